@@ -8,19 +8,22 @@ string generated by SeSG.
 from dataclasses import dataclass, field
 from functools import cached_property
 
-from numpy import argsort
 from rapidfuzz.distance import Levenshtein
 from sklearn.feature_extraction.text import TfidfVectorizer  # type: ignore
-from sklearn.metrics.pairwise import cosine_similarity  # type: ignore
+from sklearn.metrics.pairwise import linear_kernel  # type: ignore
 
-from .graph import directed_adjacency_list_to_undirected, snowballing
+from .graph import (
+    contiguous_snowballing,
+    directed_adjacency_list_to_undirected,
+    to_contiguous_adjacency_list,
+)
 
 
 def similarity_score(
     small_set: list[str],
     other_set: list[str],
 ) -> list[tuple[int, int]]:
-    """Uses `TfidfVectorizer`, `cosine_similarity`, and `Levenshtein` to calculate the intersection of two sets of strings.
+    """Uses `TfidfVectorizer`, cosine similarity, and `Levenshtein` to calculate the intersection of two sets of strings.
 
     You might need to preprocess the strings with [`process_title`][sesg.evaluation.evaluation_factory.process_title].
 
@@ -51,22 +54,21 @@ def similarity_score(
     first_set_matrix = tfidf_matrix[0 : len(small_set)]
     second_set_matrix = tfidf_matrix[len(small_set) : len(small_set) + len(other_set)]
 
-    similarity_matrix = cosine_similarity(
+    # the rows of `tfidf_matrix` are L2 normalized, so the linear kernel
+    # (dot product) is equal to the cosine similarity
+    similarity_matrix = linear_kernel(
         first_set_matrix,
         second_set_matrix,
     )
 
-    lines: int
-    lines, _ = similarity_matrix.shape
+    # index of the closest element in the second set, for each element of the first set
+    closest_elements_indexes: list[int] = similarity_matrix.argmax(axis=1).tolist()
 
     similars: list[tuple[int, int]] = []
 
-    for index_of_first_set_element in range(lines):
-        # contains the row of the similarity matrix for the current element
-        line = similarity_matrix[index_of_first_set_element]
-
-        index_of_closest_element_in_second_set: int = argsort(line)[-1]
-
+    for index_of_first_set_element, index_of_closest_element_in_second_set in enumerate(
+        closest_elements_indexes
+    ):
         first_set_element = small_set[index_of_first_set_element]
         second_set_element = other_set[index_of_closest_element_in_second_set]
 
@@ -121,10 +123,12 @@ def get_directed_adjacency_list_from_gs(
     return adjacency_list
 
 
-@dataclass(unsafe_hash=True)
+@dataclass(unsafe_hash=True, slots=True)
 class Study:
     """Represents a study.
 
+    The preprocessed title (see [`process_title`][sesg.evaluation.evaluation_factory.process_title]) is computed once, on initialization, and stored in `processed_title`.
+
     Args:
         id (int): Study's ID.
         title (str): Study's title.
@@ -136,10 +140,11 @@ class Study:
 
     references: list["Study"] = field(default_factory=list)
 
-    @cached_property
-    def processed_title(self):
-        """Preprocessed title."""
-        return process_title(self.title)
+    processed_title: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Preprocesses the title."""
+        self.processed_title = process_title(self.title)
 
 
 @dataclass(frozen=True)
@@ -252,6 +257,11 @@ class EvaluationFactory:
     def _get_study_by_id(self, id: int) -> Study:
         return self.studies_dict[id]
 
+    @cached_property
+    def gs_indexes(self) -> dict[int, int]:
+        """Dictionary mapping a study ID to its index in the GS."""
+        return {s.id: i for i, s in enumerate(self.gs)}
+
     @cached_property
     def directed_adjacency_list(self) -> dict[int, list[int]]:
         """Directed adjacency list of the GS."""
@@ -262,6 +272,22 @@ class EvaluationFactory:
         """Undirected adjacency list of the GS."""
         return directed_adjacency_list_to_undirected(self.directed_adjacency_list)
 
+    @cached_property
+    def contiguous_directed_adjacency_list(self) -> list[list[int]]:
+        """Directed adjacency list of the GS, where a study is identified by its index in the GS."""  # noqa: E501
+        return to_contiguous_adjacency_list(
+            self.directed_adjacency_list,
+            nodes=[s.id for s in self.gs],
+        )
+
+    @cached_property
+    def contiguous_undirected_adjacency_list(self) -> list[list[int]]:
+        """Undirected adjacency list of the GS, where a study is identified by its index in the GS."""  # noqa: E501
+        return to_contiguous_adjacency_list(
+            self.undirected_adjacency_list,
+            nodes=[s.id for s in self.gs],
+        )
+
     def get_qgs_in_scopus(
         self,
         processed_scopus_titles: list[str],
@@ -291,24 +317,24 @@ class EvaluationFactory:
         gs_in_scopus: list[Study],
     ) -> list[Study]:
         """Get GS studies that were found via backward snowballing."""
-        gs_in_bsb = snowballing(
-            adjacency_list=self.directed_adjacency_list,
-            start_set=[s.id for s in gs_in_scopus],
+        gs_in_bsb = contiguous_snowballing(
+            adjacency_list=self.contiguous_directed_adjacency_list,
+            start_set=[self.gs_indexes[s.id] for s in gs_in_scopus],
         )
 
-        return [self._get_study_by_id(id) for id in gs_in_bsb]
+        return [self.gs[i] for i in gs_in_bsb]
 
     def get_gs_in_sb(
         self,
         gs_in_scopus: list[Study],
     ) -> list[Study]:
         """Get GS studies that were found via backward or forward snowballing."""
-        gs_in_bsb = snowballing(
-            adjacency_list=self.undirected_adjacency_list,
-            start_set=[s.id for s in gs_in_scopus],
+        gs_in_bsb = contiguous_snowballing(
+            adjacency_list=self.contiguous_undirected_adjacency_list,
+            start_set=[self.gs_indexes[s.id] for s in gs_in_scopus],
         )
 
-        return [self._get_study_by_id(id) for id in gs_in_bsb]
+        return [self.gs[i] for i in gs_in_bsb]
 
     def evaluate(
         self,
@@ -41,12 +41,14 @@ def _breadth_first_search(
     *,
     adjacency_list: dict[int, list[int]],
     starting_node: int,
+    visited: Optional[set[int]] = None,
 ) -> list[int]:
     """Runs breadth first search on a graph. Inspired by this [blog](https://www.geeksforgeeks.org/breadth-first-search-or-bfs-for-a-graph/).
 
     Args:
         adjacency_list (dict[int, list[int]]): A dict mapping node IDs to their list of neighbors.
         starting_node (int): Node where to start the search.
+        visited (Optional[set[int]]): Nodes that were already visited, and will not be visited again. It is updated in place with the nodes reached by this search. If None, will default to an empty set.
 
     Returns:
         List of nodes connected to the starting node by a path.
@@ -60,13 +62,18 @@ def _breadth_first_search(
         >>> _breadth_first_search(adjacency_list=adjacency_list, starting_node=2)
         [2, 4, 6, 5, 3]
     """  # noqa: E501
+    if visited is None:
+        visited = set()
+
+    if starting_node in visited:
+        return []
+
     reachable_nodes: list[int] = []
     q: deque[int] = deque()
-    visited: dict[int, bool] = defaultdict(lambda: False)
 
     s = starting_node
     q.append(s)
-    visited[s] = True
+    visited.add(s)
 
     while len(q) != 0:
         s = q.pop()
@@ -76,9 +83,9 @@ def _breadth_first_search(
             continue
 
         for adjacent_node in adjacency_list[s]:
-            if not visited[adjacent_node]:
+            if adjacent_node not in visited:
                 q.append(adjacent_node)
-                visited[adjacent_node] = True
+                visited.add(adjacent_node)
 
     return reachable_nodes
 
@@ -90,7 +97,8 @@ def snowballing(
 ) -> list[int]:
     """Runs snowballing on a graph represented by an adjacency list.
 
-    Snowballing is performed by running a BFS (breadth first search) on each study of the start set
+    Snowballing is performed by running a BFS (breadth first search) on each study of the start set.
+    The searches share the visited nodes, so a node reached by a previous search is not traversed again.
 
     Args:
         adjacency_list (dict[int, list[int]]): A dict mapping a study ID to it's neighbors (citation/references).
@@ -109,19 +117,90 @@ def snowballing(
         >>> snowballing(adjacency_list=adjacency_list, start_set=[4, 7])
         [4, 5, 6, 7, 8, 9]
     """  # noqa: E501
-    snowballing_nodes: list[int] = []
+    visited: set[int] = set()
 
     for node in start_set:
-        result = _breadth_first_search(
+        _breadth_first_search(
             adjacency_list=adjacency_list,
             starting_node=node,
+            visited=visited,
         )
 
-        snowballing_nodes.extend(result)
+    # `visited` holds every node reached by the searches, without duplicates
+    return list(visited)
+
+
+def to_contiguous_adjacency_list(
+    adjacency_list: dict[int, list[int]],
+    *,
+    nodes: list[int],
+) -> list[list[int]]:
+    """Converts an adjacency list to an adjacency list indexed by contiguous IDs.
+
+    The node `nodes[i]` is mapped to the ID `i`, so the neighbors of a node can be
+    accessed by indexing a list, instead of hashing the node ID.
+
+    Args:
+        adjacency_list (dict[int, list[int]]): A dict mapping node IDs to their list of neighbors.
+        nodes (list[int]): List with the ID of every node of the graph. Must include every neighbor in the adjacency list.
+
+    Returns:
+        A list where the i-th entry is the list of neighbors of `nodes[i]`, using the contiguous IDs.
+
+    Examples:
+        >>> to_contiguous_adjacency_list({10: [20, 30], 20: [30]}, nodes=[10, 20, 30])
+        [[1, 2], [2], []]
+    """  # noqa: E501
+    node_indexes = {node: i for i, node in enumerate(nodes)}
+
+    return [
+        [node_indexes[neighbor] for neighbor in adjacency_list.get(node, [])]
+        for node in nodes
+    ]
+
+
+def contiguous_snowballing(
+    *,
+    adjacency_list: list[list[int]],
+    start_set: list[int],
+) -> list[int]:
+    """Runs snowballing on a graph represented by an adjacency list indexed by contiguous IDs.
+
+    Same as [`snowballing`][sesg.evaluation.graph.snowballing], but for the adjacency lists
+    created by [`to_contiguous_adjacency_list`][sesg.evaluation.graph.to_contiguous_adjacency_list].
+
+    Args:
+        adjacency_list (list[list[int]]): A list where the i-th entry is the list of neighbors of the node `i`.
+        start_set (list[int]): List with the contiguous ID of the studies of the start set.
+
+    Returns:
+        Sorted list of contiguous IDs that can be found via snowballing on the start set.
+
+    Examples:
+        >>> contiguous_snowballing(adjacency_list=[[1], [2, 3], [], [4, 5], [], []], start_set=[3])
+        [3, 4, 5]
+    """  # noqa: E501
+    # the visited nodes are marked by their position,
+    # so the searches do not need to hash any node.
+    visited = bytearray(len(adjacency_list))
+    q: deque[int] = deque()
+
+    for node in start_set:
+        if visited[node]:
+            continue
+
+        q.append(node)
+        visited[node] = True
+
+        while len(q) != 0:
+            s = q.pop()
 
-    snowballing_nodes_without_duplicates = list(set(snowballing_nodes))
+            for adjacent_node in adjacency_list[s]:
+                if not visited[adjacent_node]:
+                    q.append(adjacent_node)
+                    visited[adjacent_node] = True
 
-    return snowballing_nodes_without_duplicates
+    return [node for node, is_visited in enumerate(visited) if is_visited]
 
 
 def create_citation_graph(
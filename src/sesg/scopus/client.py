@@ -4,12 +4,12 @@ It is highly recommended to use [`trio`](https://trio.readthedocs.io/) to run as
 as it was much faster on our tests.
 """  # noqa: E501
 
-import math
+import json
 from dataclasses import dataclass
 from functools import partial
 from json.decoder import JSONDecodeError
 from ssl import SSLError
-from typing import Any, AsyncIterable, NoReturn
+from typing import Any, AsyncIterable, Iterable, NoReturn
 
 import aiometer
 import httpx
@@ -31,7 +31,7 @@ MAX_ATTEMPTS_ON_SCOPUS_INTERNAL_ERROR = 5
 MAX_ATTEMPTS_ON_SSL_ERROR = 5
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Page:
     """A successfull Scopus Response.
 
@@ -42,7 +42,7 @@ class Page:
         entries (list[Entry]): Studies returned from the API.
     """  # noqa: E501
 
-    @dataclass
+    @dataclass(slots=True)
     class Entry:
         """A study entry returned from the API.
 
@@ -74,12 +74,15 @@ def parse_response(
     Returns:
         A [`Page`][sesg.scopus.client.Page] instance.
     """  # noqa: E501
-    json = response.json()
+    # `json.loads` detects the UTF encoding of the raw bytes by itself, so the body
+    # does not need to be decoded into a string first, as `response.json()` does.
+    search_results = json.loads(response.content)["search-results"]
 
-    number_of_results = int(json["search-results"]["opensearch:totalResults"])
-    start_index = int(json["search-results"]["opensearch:startIndex"])
-    current_page = math.floor(start_index / 25) + 1
-    number_of_pages = min(math.ceil(number_of_results / 25), 200)
+    number_of_results = int(search_results["opensearch:totalResults"])
+    start_index = int(search_results["opensearch:startIndex"])
+    # integer division, instead of rounding the result of a float division
+    current_page = start_index // 25 + 1
+    number_of_pages = min(-(-number_of_results // 25), 200)
 
     entries = [
         Page.Entry(
@@ -88,7 +91,7 @@ def parse_response(
             cited_by_count=entry.get("citedby-count", None),
             _rest=entry,
         )
-        for entry in json["search-results"]["entry"]
+        for entry in search_results["entry"]
         if "dc:title" in entry
     ]
 
@@ -116,6 +119,22 @@ def check_api_key_is_expired(
     return response.status_code == 429
 
 
+def check_api_key_quota_is_exhausted(
+    response: httpx.Response,
+) -> bool:
+    """Checks if the given response indicates that the API key has no remaining quota.
+
+    Scopus reports the remaining quota of the API key in the `X-RateLimit-Remaining` header. When it reaches 0, the next request with this API key will get a 429 response.
+
+    Args:
+        response (httpx.Response): Response to check.
+
+    Returns:
+        True if the API key has no remaining quota, False otherwise.
+    """  # noqa: E501
+    return response.headers.get("X-RateLimit-Remaining") == "0"
+
+
 def check_string_is_invalid(
     response: httpx.Response,
 ) -> bool:
@@ -132,27 +151,36 @@ def check_string_is_invalid(
     return response.status_code in (400, 413)
 
 
-def create_clients_list(
-    api_keys_list: list[str],
-) -> list[httpx.AsyncClient]:
-    """Creates a list of async httpx clients that can be used for Scopus queries.
+def create_client(
+    *,
+    transport: httpx.AsyncBaseTransport | None = None,
+    http2: bool = False,
+) -> httpx.AsyncClient:
+    """Creates an async httpx client that can be used for Scopus queries.
+
+    The API key is not bound to the client, and must be sent as the `apiKey` parameter of each request.
+    This way, all API keys share the same connection pool.
 
     Args:
-        api_keys_list (list[str]): List with the API keys to be used. Each client will use one API Key.
+        transport (httpx.AsyncBaseTransport | None, optional): Transport that holds the connection pool. If None, a new pool is created. Defaults to None.
+        http2 (bool, optional): Whether to multiplex the concurrent requests over HTTP/2 connections. Defaults to False.
 
     Returns:
-        List of async clients.
+        An async client.
+
+    !!!note
+        HTTP/2 support requires the `h2` package, which can be installed with `pip install httpx[http2]`.
     """  # noqa: E501
-    return [
-        httpx.AsyncClient(
-            base_url=SCOPUS_API_URL,
-            params={
-                "apiKey": api_key,
-            },
-            timeout=None,
-        )
-        for api_key in api_keys_list
-    ]
+    return httpx.AsyncClient(
+        base_url=SCOPUS_API_URL,
+        timeout=None,
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+        ),
+        transport=transport,
+        http2=http2,
+    )
 
 
 class ScopusParams(TypedDict):
@@ -255,10 +283,12 @@ class ScopusClient:
     Attributes:
         DUMMY_QUERY (str): Used when a dummy query is needed. This value is used, for example, to check if the API key is expired.
 
-    To perform a search, use the [`search`][sesg.scopus.client.ScopusClient.search] method.
+    To perform a search, use the [`search`][sesg.scopus.client.ScopusClient.search] method. To consume the studies one by one, as soon as their page arrives, use the [`iter_entries`][sesg.scopus.client.ScopusClient.iter_entries] method.
+
+    All API keys share a single connection pool. To release it, use the client as an async context manager, or call the [`close`][sesg.scopus.client.ScopusClient.close] method.
 
     !!!note
-        You can purge the expired API keys with the `purge_expired_keys` method.
+        You can purge the expired API keys with the `purge_expired_api_keys` method.
     """  # noqa: E501
 
     DUMMY_QUERY = "test"
@@ -266,35 +296,73 @@ class ScopusClient:
     def __init__(
         self,
         api_keys_list: list[str],
+        *,
+        client: httpx.AsyncClient | None = None,
+        http2: bool = False,
     ) -> None:
         """Initializes the instance.
 
         Args:
             api_keys_list (list[str]): List with API keys.
+            client (httpx.AsyncClient | None, optional): Client to send the requests with. Pass the same client to many instances so they share its connection pool. If None, a new client is created, and closed together with the instance. Defaults to None.
+            http2 (bool, optional): Whether the client created by this instance should use HTTP/2. Ignored when `client` is given. See [`create_client`][sesg.scopus.client.create_client]. Defaults to False.
+
+        !!!note
+            A client passed by the caller is not closed by [`close`][sesg.scopus.client.ScopusClient.close]. The caller is responsible for closing it.
         """  # noqa: E501
-        self.clients_list = MutableCycle(create_clients_list(api_keys_list))
+        self._owns_client = client is None
+        self.client = client if client is not None else create_client(http2=http2)
+        self.api_keys = MutableCycle(api_keys_list)
 
-    def delete_client(
+    async def __aenter__(self) -> "ScopusClient":
+        """Enters the async context."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Closes the client when exiting the async context."""
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the connection pool, if the client was created by this instance."""
+        if self._owns_client:
+            await self.client.aclose()
+
+    async def warmup(self) -> None:
+        """Opens a connection to the Scopus API ahead of the first search.
+
+        Sends a `HEAD` request without an API key, so no quota is spent. The connection is kept alive in the pool, so the first search does not pay for the DNS lookup and the TCP and TLS handshakes. Errors are ignored, since the searches will open their own connections anyway.
+
+        !!!note
+            To overlap the warm up with other setup work, schedule it as a task, as in `asyncio.create_task(client.warmup())`.
+        """  # noqa: E501
+        try:
+            await self.client.head("")
+        except httpx.HTTPError:
+            pass
+
+    def delete_api_key(
         self,
-        client: httpx.AsyncClient,
+        api_key: str,
     ) -> None:
-        """Deletes a client from the list of clients.
+        """Deletes an API key from the cycle of API keys.
 
-        Used when the client's API key is expired.
+        Used when the API key is expired.
 
         Args:
-            client (httpx.AsyncClient): Client to be deleted.
+            api_key (str): API key to be deleted.
         """
-        self.clients_list.delete_item(client)
+        self.api_keys.delete_item(api_key)
 
     async def fetch(
         self,
         params: ScopusParams,
     ) -> httpx.Response:
-        """Sends a request with the given params, if a client is available and returns the response.
+        """Sends a request with the given params, if an API key is available and returns the response.
 
         Will recursively retry with another API key if the response's status code is 429.
 
+        If the response reports that the API key has no remaining quota, the API key is deleted right away, instead of wasting a request to get a 429 response.
+
         Args:
             params (ScopusParams): Dictionary with the fetch parameters.
 
@@ -306,20 +374,26 @@ class ScopusClient:
             The response obtained.
         """  # noqa: E501
         try:
-            client = next(self.clients_list)
+            api_key = next(self.api_keys)
         except StopIteration:
             raise OutOfAPIKeysError()
 
-        response = await client.get("", params=params)  # type: ignore
+        response = await self.client.get(
+            "",
+            params={"apiKey": api_key, **params},  # type: ignore
+        )
 
         if check_string_is_invalid(response):
             raise InvalidStringError()
 
         if check_api_key_is_expired(response):
-            self.delete_client(client)
+            self.delete_api_key(api_key)
 
             return await self.fetch(params)
 
+        if check_api_key_quota_is_exhausted(response):
+            self.delete_api_key(api_key)
+
         return response
 
     async def fetch_first_page(
@@ -421,51 +495,140 @@ class ScopusClient:
             self.fetch_and_parse,
             params_list,
             max_at_once=max_concurrent_tasks,
-            max_per_second=len(self.clients_list) * MAX_REQUESTS_PER_SECOND_PER_API_KEY,
+            max_per_second=len(self.api_keys) * MAX_REQUESTS_PER_SECOND_PER_API_KEY,
         ) as next_pages:
             async for page in next_pages:
                 yield page
 
-    async def get_expired_clients(self) -> list[httpx.AsyncClient]:
-        """Verifies which clients have expired API keys.
+    async def iter_entries(
+        self,
+        query: str,
+        max_concurrent_tasks: int | None = None,
+    ) -> AsyncIterable[Page.Entry]:
+        """Same as [`search`][sesg.scopus.client.ScopusClient.search], but yields the entries of each page, one at a time.
+
+        Args:
+            query (str): The query to search for.
+            max_concurrent_tasks (Optional[int]): The maximum number of concurrently running tasks. If None, will set to the number of pages of the query.
+
+        Yields:
+            A [`Page.Entry`][sesg.scopus.client.Page.Entry] instance.
+        """  # noqa: E501
+        async for page in self.search(query, max_concurrent_tasks):
+            for entry in page.entries:
+                yield entry
+
+    async def _fetch_and_parse_with_query(
+        self,
+        params: ScopusParams,
+    ) -> tuple[str, Page]:
+        """Same as [`fetch_and_parse`][sesg.scopus.client.ScopusClient.fetch_and_parse], but also returns the query of the request.
+
+        Args:
+            params (ScopusParams): Parameters of the request.
+
+        Returns:
+            A tuple with the query and the parsed response.
+        """  # noqa: E501
+        page = await self.fetch_and_parse(params)
+
+        return params["query"], page
+
+    async def search_many(
+        self,
+        queries: Iterable[str],
+        max_concurrent_tasks: int | None = None,
+    ) -> AsyncIterable[tuple[str, Page]]:
+        """Performs concurrent requests to all of the pages of all of the given queries.
+
+        First, the first pages of all queries are requested concurrently. Then, the remaining pages of all queries are requested together, sharing the same connection pool and rate limit.
+
+        Args:
+            queries (Iterable[str]): The queries to search for.
+            max_concurrent_tasks (Optional[int]): The maximum number of concurrently running tasks. If None, will set to the number of requests of each step.
+
+        Raises:
+            InvalidStringError: If the response has a status code of 400 or 413.
+            TooManyJSONDecodeErrors: If the maximum number of attempts on JSONDecodeError is reached.
+            TooManyKeyErrors: If the maximum number of attempts on KeyError is reached.
+            OutOfAPIKeysError: If all API keys are expired.
+
+        Yields:
+            A tuple with the query and a [`Page`][sesg.scopus.client.Page] of that query. Pages are yielded as soon as they are fetched, so pages of different queries are interleaved.
+        """  # noqa: E501
+        first_params_list: list[ScopusParams] = [
+            {
+                "query": query,
+                "start": 0,
+            }
+            for query in queries
+        ]
+        max_per_second = len(self.api_keys) * MAX_REQUESTS_PER_SECOND_PER_API_KEY
+
+        params_list: list[ScopusParams] = []
+
+        async with aiometer.amap(
+            self._fetch_and_parse_with_query,
+            first_params_list,
+            max_at_once=max_concurrent_tasks or max(len(first_params_list), 1),
+            max_per_second=max_per_second,
+        ) as first_pages:
+            async for query, page in first_pages:
+                params_list.extend(create_params_pagination(query, page.n_results))
+
+                yield query, page
+
+        async with aiometer.amap(
+            self._fetch_and_parse_with_query,
+            params_list,
+            max_at_once=max_concurrent_tasks or max(len(params_list), 1),
+            max_per_second=max_per_second,
+        ) as next_pages:
+            async for query, page in next_pages:
+                yield query, page
+
+    async def get_expired_api_keys(self) -> list[str]:
+        """Verifies which API keys are expired.
 
         Returns:
-            List of clients with expired API keys.
+            List of expired API keys.
         """
         params: ScopusParams = {
             "query": ScopusClient.DUMMY_QUERY,
             "start": 0,
         }
 
+        api_keys = self.api_keys.items
+
         fns = [
             partial(
-                client.get,
+                self.client.get,
                 "",
-                params=params,  # type: ignore
+                params={"apiKey": api_key, **params},  # type: ignore
             )
-            for client in self.clients_list.items
+            for api_key in api_keys
         ]
 
         responses = await aiometer.run_all(
             fns,
-            max_at_once=len(self.clients_list),
-            max_per_second=len(self.clients_list),
+            max_at_once=len(api_keys),
+            max_per_second=len(api_keys) * MAX_REQUESTS_PER_SECOND_PER_API_KEY,
         )
 
-        expired_clients: list[httpx.AsyncClient] = []
+        expired_api_keys: list[str] = []
 
-        for client, response in zip(
-            self.clients_list.items,
+        for api_key, response in zip(
+            api_keys,
             responses,
         ):
             if check_api_key_is_expired(response):
-                expired_clients.append(client)
+                expired_api_keys.append(api_key)
 
-        return expired_clients
+        return expired_api_keys
 
-    async def purge_expired_clients(self):
-        """Removes all clients with expired API keys from the list of clients."""
-        expired_clients = await self.get_expired_clients()
+    async def purge_expired_api_keys(self):
+        """Removes all expired API keys from the cycle of API keys."""
+        expired_api_keys = await self.get_expired_api_keys()
 
-        for client in expired_clients:
-            self.delete_client(client)
+        for api_key in expired_api_keys:
+            self.delete_api_key(api_key)
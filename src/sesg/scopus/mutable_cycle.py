@@ -1,14 +1,33 @@
 """Provides a MutableCycle class."""
 
-from collections import deque
-from typing import Generic, TypeVar
+from dataclasses import dataclass, field
+from typing import Generic, Hashable, TypeVar
 
 
-T = TypeVar("T")
+T = TypeVar("T", bound=Hashable)
+
+
+@dataclass(slots=True, eq=False)
+class _Node(Generic[T]):
+    """Node of a circular doubly linked list."""
+
+    value: T
+    prev: "_Node[T]" = field(init=False)
+    next: "_Node[T]" = field(init=False)
+
+    def __post_init__(self):
+        self.prev = self
+        self.next = self
 
 
 class MutableCycle(Generic[T]):
-    """Similar to `itertools.cycle`, with the addition of a `.delete_item` method, that removes an item from the cycle."""  # noqa: E501
+    """Similar to `itertools.cycle`, with the addition of a `.delete_item` method, that removes an item from the cycle.
+
+    The items are kept in a circular doubly linked list, indexed by a dict, so `next`, `len` and `.delete_item` are all O(1).
+
+    !!!note
+        The items must be hashable. Repeated items are only kept once.
+    """  # noqa: E501
 
     def __init__(self, items: list[T]):
         """Creates a mutable cycle instance.
@@ -16,7 +35,35 @@ class MutableCycle(Generic[T]):
         Args:
             items (list[T]): Items to cycle through.
         """
-        self.items = deque(items)
+        self._index: dict[T, _Node[T]] = {}
+        self._cursor: _Node[T] | None = None
+
+        for item in dict.fromkeys(items):
+            node = _Node(item)
+            self._index[item] = node
+
+            if self._cursor is None:
+                self._cursor = node
+                continue
+
+            last = self._cursor.prev
+            node.prev = last
+            node.next = self._cursor
+            last.next = node
+            self._cursor.prev = node
+
+    @property
+    def items(self) -> list[T]:
+        """Items of the cycle, starting from the one that will be returned next."""
+        items: list[T] = []
+
+        node = self._cursor
+        for _ in range(len(self._index)):
+            assert node is not None
+            items.append(node.value)
+            node = node.next
+
+        return items
 
     def delete_item(self, item: T):
         """Deletes an item of the cycle, if it is present.
@@ -24,8 +71,19 @@ class MutableCycle(Generic[T]):
         Args:
             item (T): The item to remove.
         """
-        if item in self.items:
-            self.items.remove(item)
+        node = self._index.pop(item, None)
+        if node is None:
+            return
+
+        if not self._index:
+            self._cursor = None
+            return
+
+        node.prev.next = node.next
+        node.next.prev = node.prev
+
+        if self._cursor is node:
+            self._cursor = node.next
 
     def __iter__(self):
         """Returns an iterator."""
@@ -33,13 +91,13 @@ class MutableCycle(Generic[T]):
 
     def __next__(self) -> T:
         """Returns the next item of the cycle."""
-        if not self.items:
+        if self._cursor is None:
             raise StopIteration()
 
-        item = self.items.popleft()
-        self.items.append(item)
-        return item
+        node = self._cursor
+        self._cursor = node.next
+        return node.value
 
     def __len__(self):
         """Returns the number of items in the cycle."""
-        return len(self.items)
+        return len(self._index)
@@ -39,6 +39,38 @@ def set_pub_year_boundaries(
     return string
 
 
+def _join_surrounded_tokens(
+    tokens: list[str],
+    operator: Literal["AND", "OR"],
+    *,
+    left: str,
+    right: str,
+) -> str:
+    """Joins the tokens using the provided operator, surrounding each one with `left` and `right`.
+
+    The surroundings between two tokens are part of the separator, so the tokens are not formatted one by one.
+
+    Args:
+        tokens (list[str]): Tokens to join.
+        operator (Literal["AND", "OR"]): Operator to use to join.
+        left (str): String to put before each token.
+        right (str): String to put after each token.
+
+    Returns:
+        A string with the joined tokens.
+
+    Examples:
+        >>> _join_surrounded_tokens(["machine", "learning"], "AND", left='("', right='")')
+        '("machine") AND ("learning")'
+        >>> _join_surrounded_tokens([], "AND", left='"', right='"')
+        ''
+    """  # noqa: E501
+    if not tokens:
+        return ""
+
+    return left + f"{right} {operator} {left}".join(tokens) + right
+
+
 def join_tokens_with_operator(
     tokens: Iterable[str],
     operator: Literal["AND", "OR"],
@@ -64,13 +96,21 @@ def join_tokens_with_operator(
         >>> join_tokens_with_operator(["machine", "learning", "SLR"], "AND", use_double_quotes=True)
         '"machine" AND "learning" AND "SLR"'
     """  # noqa: E501
+    left = ""
+    right = ""
+
     if use_double_quotes:
-        tokens = (f'"{token}"' for token in tokens)
+        left += '"'
+        right = '"' + right
 
     if use_parenthesis:
-        tokens = (f"({token})" for token in tokens)
+        left = "(" + left
+        right += ")"
 
-    return f" {operator} ".join(tokens)
+    # `str.join` would build a list from a generator anyway
+    tokens = tokens if isinstance(tokens, list) else list(tokens)
+
+    return _join_surrounded_tokens(tokens, operator, left=left, right=right)
 
 
 def join_topics_without_similar_words(
@@ -93,14 +133,14 @@ def join_topics_without_similar_words(
         >>> join_topics_without_similar_words([["machine", "learning"], ["code", "smell"]])
         '("machine" AND "learning") OR ("code" AND "smell")'
     """  # noqa: E501
-    topics_part: list[str] = []
-    for topic_words in topics:
+    topics_part = [
         # words from the same topic are joined with AND
-        s = join_tokens_with_operator(topic_words, "AND", use_double_quotes=True)
-        topics_part.append(s)
+        _join_surrounded_tokens(topic_words, "AND", left='"', right='"')
+        for topic_words in topics
+    ]
 
     # topics are joined with OR
-    string = join_tokens_with_operator(topics_part, "OR", use_parenthesis=True)
+    string = _join_surrounded_tokens(topics_part, "OR", left="(", right=")")
 
     return string
 
@@ -128,20 +168,24 @@ def join_topics_with_similar_words(
         ... ])
         '(("machine" OR "computer") AND ("learning" OR "knowledge")) OR (("code" OR "software") AND ("smell" OR "defect"))'
     """  # noqa: E501
-    topics_part: list[str] = []
-    for topic in topics:
-        similar_words_part: list[str] = []
-        for similar_words in topic:
-            # similar words are joined with OR
-            s = join_tokens_with_operator(similar_words, "OR", use_double_quotes=True)
-            similar_words_part.append(s)
-
+    # every level is built with a single `str.join` over a list, without going
+    # through `join_tokens_with_operator` for each set of similar words
+    topics_part = [
         # sets of similar words are joined with AND
-        s = join_tokens_with_operator(similar_words_part, "AND", use_parenthesis=True)
-        topics_part.append(s)
+        " AND ".join(
+            [
+                # similar words are joined with OR
+                "("
+                + _join_surrounded_tokens(similar_words, "OR", left='"', right='"')
+                + ")"
+                for similar_words in topic
+            ]
+        )
+        for topic in topics
+    ]
 
     # topics are joined with OR
-    string = join_tokens_with_operator(topics_part, "OR", use_parenthesis=True)
+    string = _join_surrounded_tokens(topics_part, "OR", left="(", right=")")
 
     return string
 
@@ -1,7 +1,10 @@
 """Search string generation."""
 
 
-from sesg.similar_words.protocol import SimilarWordsGenerator
+from sesg.similar_words.protocol import (
+    BatchSimilarWordsGenerator,
+    SimilarWordsGenerator,
+)
 from sesg.similar_words.stemming_filter import filter_with_stemming
 
 from .formulation import (
@@ -48,6 +51,9 @@ def generate_search_string_with_similar_words(
     1. Reduces the number of words per topic.
     1. For each word in each topic, finds similar words with the given function.
 
+    If the generator implements [`BatchSimilarWordsGenerator`][sesg.similar_words.protocol.BatchSimilarWordsGenerator],
+    the similar words of all words are generated with a single call.
+
     Args:
         topics (list[list[str]]): List of topics to use.
         n_words_per_topic (int): Number of words to keep in each topic.
@@ -62,12 +68,24 @@ def generate_search_string_with_similar_words(
         n_words_per_topic=n_words_per_topic,
     )
 
+    # a word may appear in more than one topic, but its similar words are generated once
+    unique_tokens = list(
+        dict.fromkeys(token for topic in topics_list for token in topic)
+    )
+
+    if isinstance(similar_words_generator, BatchSimilarWordsGenerator):
+        similar_words_list = similar_words_generator.generate_batch(unique_tokens)
+    else:
+        similar_words_list = [similar_words_generator(token) for token in unique_tokens]
+
+    similar_words_by_token = dict(zip(unique_tokens, similar_words_list))
+
     topics_with_similar_words: list[list[list[str]]] = []
 
     for topic in topics_list:
         topic_part: list[list[str]] = []
         for token in topic:
-            similar_words = similar_words_generator(token)
+            similar_words = similar_words_by_token[token]
             similar_words = filter_with_stemming(
                 token,
                 similar_words_list=similar_words,
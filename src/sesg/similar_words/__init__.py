@@ -5,12 +5,15 @@ and filtering them.
 """
 
 from .bert_strategy import BertSimilarWordsGenerator
-from .protocol import SimilarWordsGenerator
+from .cache import CachedSimilarWordsGenerator
+from .protocol import BatchSimilarWordsGenerator, SimilarWordsGenerator
 from .stemming_filter import filter_with_stemming
 
 
 __all__ = (
     "filter_with_stemming",
+    "BatchSimilarWordsGenerator",
     "BertSimilarWordsGenerator",
+    "CachedSimilarWordsGenerator",
     "SimilarWordsGenerator",
 )
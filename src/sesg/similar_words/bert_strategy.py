@@ -1,9 +1,10 @@
 """Generate similar words using BERT."""
 
-from dataclasses import dataclass
+import math
+from contextlib import nullcontext
+from dataclasses import dataclass, field
 from typing import Any, TypedDict
 
-import numpy as np
 import torch
 
 from .protocol import SimilarWordsGenerator
@@ -55,10 +56,14 @@ class EnrichmentStudy(TypedDict):
 class BertSimilarWordsGenerator(SimilarWordsGenerator):
     """Generate similar words using BERT.
 
+    The enrichment text is split into sentences once, on initialization, and each sentence is tokenized at most once, when a word first selects it.
+
     Attributes:
         enrichment_text (str): Text that will be used to find similar words.
         bert_tokenizer (Any): A BERT tokenizer. For example, `BertTokenizer.from_pretrained("bert-base-uncased")`.
         bert_model (Any): A BERT model. For example, `BertForMaskedLM.from_pretrained("bert-base-uncased")`.
+        pad_to_multiple_of (Optional[int]): If set, the length of the inputs is padded to a multiple of this value. On GPUs with Tensor Cores, using 8 with half precision allows the use of the faster kernels. Defaults to None.
+        autocast_dtype (Optional[torch.dtype]): If set, the forward pass runs under `torch.autocast` with this dtype, such as `torch.bfloat16` on CPUs that support it, or `torch.float16` on GPUs. Lower precision may change the order of close predictions. Defaults to None.
     """  # noqa: E501
 
     @staticmethod
@@ -95,32 +100,57 @@ class BertSimilarWordsGenerator(SimilarWordsGenerator):
     enrichment_text: str
     bert_tokenizer: Any
     bert_model: Any
+    pad_to_multiple_of: int | None = None
+    autocast_dtype: torch.dtype | None = None
 
-    def __call__(self, word: str) -> list[str]:
-        """Generate similar words using BERT.
+    _sentences: list[str] = field(init=False, repr=False)
+    _lowered_sentences: list[str] = field(init=False, repr=False)
+    _tokenized_sentences: dict[int, list[str]] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Splits the enrichment text into sentences."""
+        self._sentences = self.enrichment_text.split(".")
+        self._lowered_sentences = [sentence.lower() for sentence in self._sentences]
+        self._tokenized_sentences = {}
+
+    def _create_masked_input(
+        self,
+        word: str,
+    ) -> tuple[list[int], list[int], int] | None:
+        """Creates the BERT input where the given word is masked.
 
         Args:
             word (str): Word from which to find similar words.
 
         Returns:
-            List of similar words.
-        """
+            A tuple with the token IDs, the segment IDs, and the index of the masked token, or None if the word can not be masked.
+        """  # noqa: E501
         if " " in word:
-            return []
-
-        selected_sentences: list[str] = []
+            return None
 
         # Treatment for if the selected sentence is the last sentence of the text (return only one sentence).  # noqa: E501
-        for sentence in self.enrichment_text.split("."):
-            if word in sentence or word in sentence.lower():
-                selected_sentences.append(sentence + ".")
+        # -1 means that no sentence was selected
+        selected_sentence_index = -1
+        for i, (sentence, lowered_sentence) in enumerate(
+            zip(self._sentences, self._lowered_sentences)
+        ):
+            if word in sentence or word in lowered_sentence:
+                selected_sentence_index = i
                 break
 
-        formated_sentences = "[CLS] "
-        for sentence in selected_sentences:
-            formated_sentences += sentence.lower() + " [SEP] "
+        # many words select the same sentence, so it is tokenized only once
+        if selected_sentence_index not in self._tokenized_sentences:
+            formated_sentences = "[CLS] "
+            if selected_sentence_index != -1:
+                sentence = self._sentences[selected_sentence_index] + "."
+                formated_sentences += sentence.lower() + " [SEP] "
 
-        tokenized_text = self.bert_tokenizer.tokenize(formated_sentences)
+            self._tokenized_sentences[
+                selected_sentence_index
+            ] = self.bert_tokenizer.tokenize(formated_sentences)
+
+        # copied, since the masked token is replaced below
+        tokenized_text = list(self._tokenized_sentences[selected_sentence_index])
 
         # Defining the masked index equal to the word of the input.
         masked_index = 0
@@ -134,7 +164,7 @@ class BertSimilarWordsGenerator(SimilarWordsGenerator):
                 word_is_in_tokens = True
 
         if not word_is_in_tokens:
-            return []
+            return None
 
         # Convert token to vocabulary indices.
         indexed_tokens = self.bert_tokenizer.convert_tokens_to_ids(tokenized_text)
@@ -144,18 +174,101 @@ class BertSimilarWordsGenerator(SimilarWordsGenerator):
         len_first = len_first + 1
         segments_ids = [0] * len_first + [1] * (len(tokenized_text) - len_first)
 
+        return indexed_tokens, segments_ids, masked_index
+
+    def __call__(self, word: str) -> list[str]:
+        """Generate similar words using BERT.
+
+        Args:
+            word (str): Word from which to find similar words.
+
+        Returns:
+            List of similar words.
+        """
+        return self.generate_batch([word])[0]
+
+    def generate_batch(self, words: list[str]) -> list[list[str]]:
+        """Generate similar words using BERT, for many words at once.
+
+        The masked inputs of all words are padded to the same length,
+        and BERT predicts all of the masked tokens in a single forward pass.
+
+        Args:
+            words (list[str]): Words from which to find similar words.
+
+        Returns:
+            List where the i-th entry is the list of similar words of the i-th word.
+        """  # noqa: E501
+        similar_words: list[list[str]] = [[] for _ in words]
+
+        masked_inputs = [
+            (i, masked_input)
+            for i, word in enumerate(words)
+            if (masked_input := self._create_masked_input(word)) is not None
+        ]
+
+        if len(masked_inputs) == 0:
+            return similar_words
+
+        max_length = max(
+            len(indexed_tokens) for _, (indexed_tokens, _, _) in masked_inputs
+        )
+
+        # padding to a multiple of 8 lets half precision matmuls use the Tensor Cores
+        if self.pad_to_multiple_of is not None:
+            max_length = math.ceil(max_length / self.pad_to_multiple_of)
+            max_length *= self.pad_to_multiple_of
+
+        pad_token_id = self.bert_tokenizer.pad_token_id
+
         # Convert the inputs to PyTorch tensors.
-        tokens_tensor = torch.tensor([indexed_tokens])
-        segments_tensors = torch.tensor([segments_ids])
+        # Padded positions are ignored by the attention, so the predictions
+        # are the same as the ones of each input alone.
+        tokens_tensor = torch.tensor(
+            [
+                indexed_tokens + [pad_token_id] * (max_length - len(indexed_tokens))
+                for _, (indexed_tokens, _, _) in masked_inputs
+            ]
+        )
+        segments_tensors = torch.tensor(
+            [
+                segments_ids + [0] * (max_length - len(segments_ids))
+                for _, (_, segments_ids, _) in masked_inputs
+            ]
+        )
+        attention_mask = torch.tensor(
+            [
+                [1] * len(indexed_tokens) + [0] * (max_length - len(indexed_tokens))
+                for _, (indexed_tokens, _, _) in masked_inputs
+            ]
+        )
+        masked_indexes = torch.tensor(
+            [masked_index for _, (_, _, masked_index) in masked_inputs]
+        )
 
         # Predict all tokens.
-        with torch.no_grad():
-            outputs = self.bert_model(tokens_tensor, token_type_ids=segments_tensors)
+        # `inference_mode` also skips the view and version tracking kept by `no_grad`.
+        device = self.bert_model.device
+        autocast = (
+            torch.autocast(device_type=device.type, dtype=self.autocast_dtype)
+            if self.autocast_dtype is not None
+            else nullcontext()
+        )
+        with torch.inference_mode(), autocast:
+            outputs = self.bert_model(
+                tokens_tensor.to(device),
+                token_type_ids=segments_tensors.to(device),
+                attention_mask=attention_mask.to(device),
+            )
             predictions = outputs[0]
 
-        # Get top thirty possibilities for the masked word.
-        predicted_index = torch.topk(predictions[0, masked_index], 30)[1]
-        predicted_index = list(np.array(predicted_index))
+        # Get top thirty possibilities for each masked word.
+        masked_predictions = predictions[
+            torch.arange(len(masked_inputs), device=device), masked_indexes.to(device)
+        ]
+        predicted_indexes: list[list[int]] = torch.topk(
+            masked_predictions, 30
+        ).indices.tolist()
 
         # ???????????????????????????????????????
         # ???????????????????????????????????????
@@ -178,10 +291,13 @@ class BertSimilarWordsGenerator(SimilarWordsGenerator):
         # ???????????????????????????????????????
         # ???????????????????????????????????????
 
-        predicted_tokens: list[str] = self.bert_tokenizer.convert_ids_to_tokens(
-            predicted_index
-        )
+        for (i, _), predicted_index in zip(masked_inputs, predicted_indexes):
+            predicted_tokens: list[str] = self.bert_tokenizer.convert_ids_to_tokens(
+                predicted_index
+            )
 
-        return [
-            token for token in predicted_tokens if not check_is_bert_oov_word(token)
-        ]
+            similar_words[i] = [
+                token for token in predicted_tokens if not check_is_bert_oov_word(token)
+            ]
+
+        return similar_words
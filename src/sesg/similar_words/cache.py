@@ -0,0 +1,85 @@
+"""Memoization of similar words generators."""
+
+from dataclasses import dataclass, field
+from typing import MutableMapping
+
+from .protocol import BatchSimilarWordsGenerator, SimilarWordsGenerator
+
+
+@dataclass
+class CachedSimilarWordsGenerator(BatchSimilarWordsGenerator):
+    """Wraps a similar words generator, remembering the similar words of each word it has seen.
+
+    Useful when many search strings are generated from the same topics, for example, when sweeping `n_words_per_topic` and `n_similar_words_per_word`, since the wrapped generator is only called for words that were not seen before.
+
+    If the wrapped generator implements [`BatchSimilarWordsGenerator`][sesg.similar_words.protocol.BatchSimilarWordsGenerator], the unseen words are generated with a single call.
+
+    Attributes:
+        similar_words_generator (SimilarWordsGenerator): Generator to memoize.
+        cache (MutableMapping[str, list[str]]): Maps each seen word to its similar words. Defaults to an empty dict.
+
+    !!!note
+        The returned lists are the ones stored in the cache, so they must not be mutated.
+
+    !!!note
+        To keep the similar words between sessions, pass a persistent mapping as the cache, such as `shelve.open(path)`.
+        The similar words depend on the model and on the enrichment text, so use a different path for each combination of them.
+
+    Examples:
+        >>> calls = []
+        >>> def generator(word):
+        ...     calls.append(word)
+        ...     return [word.upper()]
+        >>> cached = CachedSimilarWordsGenerator(generator)
+        >>> cached.generate_batch(["code", "smell", "code"])
+        [['CODE'], ['SMELL'], ['CODE']]
+        >>> cached("smell")
+        ['SMELL']
+        >>> calls
+        ['code', 'smell']
+    """  # noqa: E501
+
+    similar_words_generator: SimilarWordsGenerator
+    cache: MutableMapping[str, list[str]] = field(default_factory=dict)
+
+    def __call__(self, word: str) -> list[str]:
+        """Finds words that are similar to the given word, using the cache when possible.
+
+        Args:
+            word (str): Word from which to find similar words.
+
+        Returns:
+            List of similar words.
+        """  # noqa: E501
+        # a hit is a single lookup, without building the batch of `generate_batch`
+        try:
+            return self.cache[word]
+        except KeyError:
+            return self.generate_batch([word])[0]
+
+    def generate_batch(self, words: list[str]) -> list[list[str]]:
+        """Finds the similar words of many words, only generating the ones that are not cached.
+
+        Args:
+            words (list[str]): Words from which to find similar words.
+
+        Returns:
+            List where the i-th entry is the list of similar words of the i-th word.
+        """  # noqa: E501
+        missing_words = [
+            word for word in dict.fromkeys(words) if word not in self.cache
+        ]
+
+        if missing_words:
+            if isinstance(self.similar_words_generator, BatchSimilarWordsGenerator):
+                similar_words_list = self.similar_words_generator.generate_batch(
+                    missing_words
+                )
+            else:
+                similar_words_list = [
+                    self.similar_words_generator(word) for word in missing_words
+                ]
+
+            self.cache.update(zip(missing_words, similar_words_list))
+
+        return [self.cache[word] for word in words]
@@ -1,6 +1,6 @@
 """Protocol for similar a words generator."""
 
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
 
 class SimilarWordsGenerator(Protocol):
@@ -16,3 +16,19 @@ class SimilarWordsGenerator(Protocol):
             List of similar words.
         """
         raise NotImplementedError()
+
+
+@runtime_checkable
+class BatchSimilarWordsGenerator(SimilarWordsGenerator, Protocol):
+    """Protocol for similar a words generator that can handle many words at once."""
+
+    def generate_batch(self, words: list[str]) -> list[list[str]]:  # pragma: no cover
+        """Interface of a function that generates similar words for many words at once.
+
+        Args:
+            words (list[str]): Words from which to find similar words.
+
+        Returns:
+            List where the i-th entry is the list of similar words of the i-th word.
+        """  # noqa: E501
+        raise NotImplementedError()
@@ -4,9 +4,11 @@ Attributes:
     PUNCTUATION (set[str]): Set of punctuation characters. Defaults to `#!python set(string.punctuation)`.
 """  # noqa: E501
 
+from functools import lru_cache
 from string import punctuation
 
 from nltk.stem import LancasterStemmer  # type: ignore
+from rapidfuzz import process
 from rapidfuzz.distance import Levenshtein
 
 
@@ -16,6 +18,27 @@ PUNCTUATION: set[str] = set(punctuation)
 lancaster = LancasterStemmer()
 
 
+@lru_cache(maxsize=65536)
+def stem(
+    word: str,
+) -> str:
+    """Stems the given word with the Lancaster stemmer, memoizing the result.
+
+    The stemmer is written in pure Python, and the same similar words are generated for many words, so they are stemmed many times.
+
+    Args:
+        word (str): Word to stem.
+
+    Returns:
+        The stemmed word.
+
+    Examples:
+        >>> stem("development")
+        'develop'
+    """  # noqa: E501
+    return lancaster.stem(word)
+
+
 def check_strings_are_distant(
     s1: str,
     s2: str,
@@ -36,7 +59,14 @@ def check_strings_are_distant(
         False
     """  # noqa: E501
     levenshtein_distance = 4
-    return Levenshtein.distance(str(s1), str(s2)) > levenshtein_distance
+    # with a cutoff, rapidfuzz stops as soon as the distance is known to be greater
+    # than it, and returns `cutoff + 1`
+    distance = Levenshtein.distance(
+        str(s1),
+        str(s2),
+        score_cutoff=levenshtein_distance,
+    )
+    return distance > levenshtein_distance
 
 
 def check_strings_are_close(
@@ -59,7 +89,12 @@ def check_strings_are_close(
         True
     """  # noqa: E501
     levenshtein_distance = 4
-    return Levenshtein.distance(str(s1), str(s2)) < levenshtein_distance
+    distance = Levenshtein.distance(
+        str(s1),
+        str(s2),
+        score_cutoff=levenshtein_distance - 1,
+    )
+    return distance < levenshtein_distance
 
 
 def check_stemmed_similar_word_is_valid(
@@ -127,12 +162,16 @@ def check_stemmed_similar_word_is_duplicate(
         ... )
         True
     """  # noqa: E501
-    for word in stemmed_similar_words_list:
-        is_close = check_strings_are_close(word, stemmed_similar_word)
-        if is_close:
-            return True
+    # same as checking each word with `check_strings_are_close`, but the loop runs
+    # inside rapidfuzz, and the cutoff lets it discard distant words early
+    closest = process.extractOne(
+        stemmed_similar_word,
+        stemmed_similar_words_list,
+        scorer=Levenshtein.distance,
+        score_cutoff=3,
+    )
 
-    return False
+    return closest is not None
 
 
 def check_word_is_punctuation(
@@ -222,7 +261,7 @@ def filter_with_stemming(
     Returns:
         List of filtered similar words.
     """  # noqa: E501
-    stemmed_word: str = lancaster.stem(word)
+    stemmed_word = stem(word)
 
     # list with the filtered similar words
     relevant_similar_words: list[str] = []
@@ -231,7 +270,7 @@ def filter_with_stemming(
     stemmed_relevant_similar_words: list[str] = []
 
     for similar_word in similar_words_list:
-        stemmed_similar_word = lancaster.stem(similar_word)
+        stemmed_similar_word = stem(similar_word)
 
         similar_word_is_relevant = check_similar_word_is_relevant(
             similar_word,
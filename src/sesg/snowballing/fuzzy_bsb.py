@@ -6,14 +6,18 @@ to perform string similarity checks.
 """  # noqa: E501
 
 from itertools import islice
-from multiprocessing import Pool
 from typing import Iterable, Iterator, TypedDict, TypeVar
 
-from rapidfuzz import process
+from rapidfuzz import fuzz, process
 
 
 T = TypeVar("T")
 
+# `str.translate` removes all of the characters in a single pass, but it is only
+# fast for ASCII strings, so the chained `str.replace` calls are kept for the rest
+_TITLE_DELETION_TABLE = str.maketrans("", "", " .")
+_TEXT_DELETION_TABLE = str.maketrans("", "", "\n\r .")
+
 
 def window(
     seq: Iterable[T],
@@ -71,14 +75,71 @@ def check_title_is_in_text(
         True
     """  # noqa: E501
     window_size = len(title)
-    options = ["".join(x) for x in window(text, size=window_size)]
+    # slicing the text creates each window directly, instead of joining
+    # the characters of the tuples yielded by `window`
+    options = [
+        text[start : start + window_size]
+        for start in range(len(text) - window_size + 1)
+    ]
+
+    # the cutoff makes rapidfuzz skip the windows that can not reach it
+    result = process.extractOne(title, options, score_cutoff=90)
+
+    return result is not None
+
+
+def check_titles_are_in_text(
+    *,
+    titles: list[str],
+    text: str,
+    workers: int = -1,
+) -> list[bool]:
+    """Checks which of the titles are in a piece of text, with the same criteria as [`check_title_is_in_text`][sesg.snowballing.fuzzy_bsb.check_title_is_in_text].
 
-    result = process.extractOne(title, options)
+    The windows of the text are created once for each distinct title length, and all titles with that length are scored against them with `rapidfuzz.process.cdist`, which runs in parallel threads.
 
-    if result is not None and result[1] >= 90:
-        return True
+    Args:
+        titles (list[str]): Titles to search for.
+        text (str): Text of the study.
+        workers (int, optional): Number of threads used by rapidfuzz. If -1, uses all cores. Defaults to -1.
 
-    return False
+    Returns:
+        List where the i-th entry is True if the i-th title is in the text, False otherwise.
+
+    Examples:
+        >>> check_titles_are_in_text(
+        ...     titles=["machine learning models: a systematic literature review", "code smells"],
+        ...     text="long text here very long REFERENCES: regression tests for machine learning models: a systematic literature review",
+        ... )
+        [True, False]
+    """  # noqa: E501
+    are_in_text = [False] * len(titles)
+
+    indexes_by_length: dict[int, list[int]] = {}
+    for i, title in enumerate(titles):
+        indexes_by_length.setdefault(len(title), []).append(i)
+
+    for window_size, indexes in indexes_by_length.items():
+        options = [
+            text[start : start + window_size]
+            for start in range(len(text) - window_size + 1)
+        ]
+        if not options:
+            continue
+
+        # scores under the cutoff are set to 0
+        scores = process.cdist(
+            [titles[i] for i in indexes],
+            options,
+            scorer=fuzz.WRatio,
+            score_cutoff=90,
+            workers=workers,
+        )
+
+        for i, is_in_text in zip(indexes, (scores >= 90).any(axis=1)):
+            are_in_text[i] = bool(is_in_text)
+
+    return are_in_text
 
 
 class PooledTitleIsInTextArgs(TypedDict):
@@ -100,6 +161,9 @@ def pooled_check_title_is_in_text(
 ) -> bool:
     """Replicates [`check_title_is_in_text`][sesg.snowballing.fuzzy_bsb.check_title_is_in_text] behaviour, with slight modifications to work well with `multiprocessing.Pool`.
 
+    !!!note
+        [`fuzzy_backward_snowballing`][sesg.snowballing.fuzzy_bsb.fuzzy_backward_snowballing] no longer uses this function. To check many titles at once, prefer [`check_titles_are_in_text`][sesg.snowballing.fuzzy_bsb.check_titles_are_in_text].
+
     Args:
         args (PooledTitleIsInTextArgs): args of this function.
 
@@ -141,7 +205,12 @@ def preprocess_title(
         >>> preprocess_title(" title. HERE ")
         'titlehere'
     """
-    return title.strip().lower().replace(" ", "").replace(".", "")
+    title = title.strip().lower()
+
+    if title.isascii():
+        return title.translate(_TITLE_DELETION_TABLE)
+
+    return title.replace(" ", "").replace(".", "")
 
 
 def preprocess_text(
@@ -163,14 +232,12 @@ def preprocess_text(
         >>> preprocess_text(" text. \n \r\n HERE ")
         'texthere'
     """
-    return (
-        text.strip()
-        .lower()
-        .replace("\n", "")
-        .replace("\r", "")
-        .replace(" ", "")
-        .replace(".", "")
-    )
+    text = text.strip().lower()
+
+    if text.isascii():
+        return text.translate(_TEXT_DELETION_TABLE)
+
+    return text.replace("\n", "").replace("\r", "").replace(" ", "").replace(".", "")
 
 
 class FuzzyBackwardSnowballingStudy:
@@ -184,6 +251,8 @@ class FuzzyBackwardSnowballingStudy:
         (True, True)
     """  # noqa: E501
 
+    __slots__ = ("__id", "__title", "__text_content")
+
     __id: int
     __title: str
     __text_content: str
@@ -246,24 +315,17 @@ def fuzzy_backward_snowballing(
         (1, [2])
         (2, [])
     """  # noqa: E501
+    titles = [reference.title for reference in studies]
+
     for study_index, study in enumerate(studies):
-        with Pool() as p:
-            func_args: list[PooledTitleIsInTextArgs] = [
-                {
-                    # when `study_index == reference_index`, we are checking if study a cites itself,  # noqa: E501
-                    # so we skip and set it as False
-                    "skip": study_index == reference_index,
-                    "text": study.text_content,
-                    "title": reference.title,
-                }
-                for reference_index, reference in enumerate(studies)
-            ]
-
-            # if `is_cited_list[j]` is True then the current study cites title `j`
-            is_cited_list: list[bool] = p.map(
-                pooled_check_title_is_in_text,
-                func_args,
-            )
+        # if `is_cited_list[j]` is True then the current study cites title `j`
+        is_cited_list = check_titles_are_in_text(
+            titles=titles,
+            text=study.text_content,
+        )
+
+        # a study does not cite itself
+        is_cited_list[study_index] = False
 
         references = [ref for ref, is_cited in zip(studies, is_cited_list) if is_cited]
 
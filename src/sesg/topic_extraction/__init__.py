@@ -2,11 +2,12 @@
 
 from .bertopic_strategy import extract_topics_with_bertopic
 from .create_docs import DocStudy, create_docs
-from .lda_strategy import extract_topics_with_lda
+from .lda_strategy import LdaTopicExtractor, extract_topics_with_lda
 
 
 __all__ = (
     "DocStudy",
+    "LdaTopicExtractor",
     "create_docs",
     "extract_topics_with_bertopic",
     "extract_topics_with_lda",
@@ -1,5 +1,6 @@
 """Topic extraction with [BERTopic](https://arxiv.org/abs/2203.05794)."""
 
+import numpy as np
 from bertopic import BERTopic  # type: ignore
 from sklearn.cluster import KMeans  # type: ignore
 from sklearn.feature_extraction.text import CountVectorizer  # type: ignore
@@ -11,6 +12,7 @@ def extract_topics_with_bertopic(
     *,
     kmeans_n_clusters: int,
     umap_n_neighbors: int,
+    embeddings: np.ndarray | None = None,
 ) -> list[list[str]]:
     """Extracts topics from a list of documents using BERTopic.
 
@@ -18,6 +20,7 @@ def extract_topics_with_bertopic(
         docs (list[str]): List of documents.
         kmeans_n_clusters (int): The number of clusters to form as well as the number of centroids to generate. This is equivalent to setting the number of topics.
         umap_n_neighbors (int): Number of neighboring sample points used when making the manifold approximation. Increasing this value typically results in a more global view of the embedding structure whilst smaller values result in a more local view. Increasing this value often results in larger clusters being created.
+        embeddings (np.ndarray | None, optional): Precomputed embeddings of the documents, where the i-th row is the embedding of the i-th document. If None, BERTopic embeds the documents with its default sentence transformer. Defaults to None.
 
     Returns:
         List of topics, where a topic is a list of words.
@@ -27,6 +30,9 @@ def extract_topics_with_bertopic(
         ...     docs=["detecting code smells with machine learning", "code smells detection tools", "error detection in Java software with machine learning"],
         ... )
         [["word1 topic1", "word2 topic1"], ["word1 topic2", "word2 topic2"]]
+
+    !!!note
+        Embedding the documents is usually the most expensive step. When extracting topics many times from the same documents, for example, with different `kmeans_n_clusters`, compute the embeddings once and pass them on every call. To get the same embeddings as BERTopic, use `SentenceTransformer("all-MiniLM-L6-v2").encode(docs)`.
     """  # noqa: E501
     vectorizer_model = CountVectorizer(
         stop_words="english",
@@ -54,7 +60,7 @@ def extract_topics_with_bertopic(
         umap_model=umap_model,
     )
 
-    topic_model.fit_transform(docs)
+    topic_model.fit_transform(docs, embeddings=embeddings)
 
     # topic_model.get_topics() will return a Mapping where
     # the key is the index of the topic,
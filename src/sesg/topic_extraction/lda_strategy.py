@@ -1,47 +1,181 @@
 """Topic extraction with [LDA (Latent Dirichlet Allocation)](https://www.jmlr.org/papers/volume3/blei03a/blei03a.pdf?ref=https://githubhelp.com)."""
 
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
 from sklearn.decomposition import LatentDirichletAllocation  # type: ignore
-from sklearn.feature_extraction.text import CountVectorizer  # type: ignore
+from sklearn.feature_extraction.text import (  # type: ignore
+    CountVectorizer,
+    TfidfTransformer,
+)
 
 
-def extract_topics_with_lda(
-    docs: list[str],
-    *,
+def _create_vectorizer(
     min_document_frequency: float,
-    n_topics: int,
-) -> list[list[str]]:
-    """Extracts topics from a list of documents using LDA method.
+) -> CountVectorizer:
+    """Creates the bag of words vectorizer used before LDA.
 
     Args:
-        docs (list[str]): List of documents.
-        min_document_frequency (float): CountVectorizer parameter - Minimum document frequency for the word to appear on the bag of words.
-        n_topics (int): LDA parameter - Number of topics to generate.
+        min_document_frequency (float): Minimum document frequency for the word to appear on the bag of words.
 
     Returns:
-        list of topics, where a topic is a list of words.
-
-    Examples:
-        >>> extract_topics_with_lda(  # doctest: +SKIP
-        ...     docs=["detecting code smells with machine learning", "code smells detection tools", "error detection in Java software with machine learning"],
-        ...     min_document_frequency=0.1,
-        ...     n_topics=2,
-        ... )
-        [["word1 topic1", "word2 topic1"], ["word1 topic2", "word2 topic2"]]
+        An unfitted `CountVectorizer`.
     """  # noqa: E501
-    vectorizer = CountVectorizer(
+    # a `HashingVectorizer` would avoid building the vocabulary, but it can not
+    # map a feature back to its token, and the topics must be made of words.
+    return CountVectorizer(
+        lowercase=True,
         min_df=min_document_frequency,
         max_df=1.0,
         ngram_range=(1, 3),
         max_features=None,
         stop_words="english",
+        dtype=np.float32,
+    )
+
+
+# below this size, `np.argpartition` on the whole vocabulary is faster
+# than computing the threshold of each topic.
+_MIN_VOCABULARY_SIZE_TO_PRUNE = 10_000
+
+
+def _get_top_indexes_above_threshold(
+    components: np.ndarray,
+    n_words: int,
+) -> np.ndarray | None:
+    """Gets the indexes of the highest scores of each topic, sorting only the outstanding scores.
+
+    The scores of a topic are concentrated in a few words, so only the scores above
+    `mean + 2 * std` of the topic are sorted.
+
+    Args:
+        components (np.ndarray): LDA components, with one row of scores for each topic.
+        n_words (int): Number of indexes to get for each topic.
+
+    Returns:
+        A matrix with the indexes of the `n_words` highest scores of each topic, sorted by relevance, or None if some topic has less than `n_words` scores above the threshold.
+    """  # noqa: E501
+    thresholds = components.mean(axis=1, keepdims=True) + 2 * components.std(
+        axis=1, keepdims=True
+    )
+    candidates = components > thresholds
+
+    # the highest scores of a topic are all candidates,
+    # as long as the topic has at least `n_words` candidates
+    if candidates.sum(axis=1).min() < n_words:
+        return None
+
+    top_indexes = np.empty((len(components), n_words), dtype=np.intp)
+    for i, (topic, topic_candidates) in enumerate(zip(components, candidates)):
+        candidate_indexes = np.flatnonzero(topic_candidates)
+        order = np.argsort(-topic[candidate_indexes])[:n_words]
+        top_indexes[i] = candidate_indexes[order]
+
+    return top_indexes
+
+
+def _get_top_words(
+    feature_names: np.ndarray,
+    components: np.ndarray,
+    n_words_per_topic: int,
+) -> list[list[str]]:
+    """Gets the words with the highest scores of each topic.
+
+    Args:
+        feature_names (np.ndarray): Tokens of the bag of words, where `feature_names[i]` is the token of the i-th feature.
+        components (np.ndarray): LDA components, with one row of scores for each topic.
+        n_words_per_topic (int): Number of words to keep in each topic. If the vocabulary is smaller, all words are kept.
+
+    Returns:
+        List of topics, where a topic is a list of words sorted by relevance.
+    """  # noqa: E501
+    # `components` hold the entire list of topics found by LDA.
+    # notice that for `components`, the topic is a list of scores
+    # where the index of the score will map to a token (~word) in `feature_names`.
+
+    n_words = min(n_words_per_topic, len(feature_names))
+
+    if len(feature_names) >= _MIN_VOCABULARY_SIZE_TO_PRUNE:
+        top_indexes = _get_top_indexes_above_threshold(components, n_words)
+
+        if top_indexes is not None:
+            topics: list[list[str]] = feature_names[top_indexes].tolist()
+            return topics
+
+    # `np.argpartition` moves the indexes of the `n_words` highest scores
+    # of each topic to the beginning of the row, without sorting the whole vocabulary.
+    top_indexes = np.argpartition(-components, n_words - 1, axis=1)[:, :n_words]
+
+    # only the selected indexes are sorted, with the highest score first
+    top_scores = np.take_along_axis(components, top_indexes, axis=1)
+    top_indexes = np.take_along_axis(
+        top_indexes, np.argsort(-top_scores, axis=1), axis=1
     )
 
+    # `feature_names` is a numpy array, so indexing it with the matrix of
+    # indexes gathers the words of every topic at once.
+    topics = feature_names[top_indexes].tolist()
+
+    return topics
+
+
+@lru_cache(maxsize=8)
+def _vectorize(
+    docs: tuple[str, ...],
+    *,
+    min_document_frequency: float,
+) -> tuple[Any, np.ndarray]:
+    """Fits the bag of words on the documents, and transforms them.
+
+    The result is cached apart from the LDA fit, so sweeping `n_topics` over the same documents vectorizes them only once.
+
+    Args:
+        docs (tuple[str, ...]): Documents. Must be a tuple to be hashable.
+        min_document_frequency (float): CountVectorizer parameter - Minimum document frequency for the word to appear on the bag of words.
+
+    Returns:
+        A tuple with the term frequency matrix and the feature names. Both are shared between calls, and must not be modified.
+    """  # noqa: E501
+    vectorizer = _create_vectorizer(min_document_frequency)
+
+    # `tf` is a float32 CSR matrix, which LDA uses as is,
+    # instead of upcasting the counts to float64.
     tf = vectorizer.fit_transform(docs)
 
     # `feature_names` is a list with the vectorized words from the document.
     # meaning `feature_names[i]` is a token in the text.
     feature_names = vectorizer.get_feature_names_out()
 
+    return tf, feature_names
+
+
+@lru_cache(maxsize=8)
+def _fit_lda(
+    docs: tuple[str, ...],
+    *,
+    min_document_frequency: float,
+    n_topics: int,
+    max_iter: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Fits a bag of words and LDA on the documents.
+
+    The result is cached, so calling [`extract_topics_with_lda`][sesg.topic_extraction.extract_topics_with_lda] again with the same documents and parameters (but, for example, another `n_words_per_topic`) does not fit LDA again.
+
+    Args:
+        docs (tuple[str, ...]): Documents. Must be a tuple to be hashable.
+        min_document_frequency (float): CountVectorizer parameter - Minimum document frequency for the word to appear on the bag of words.
+        n_topics (int): LDA parameter - Number of topics to generate.
+        max_iter (int): LDA parameter - Maximum number of passes over the documents.
+
+    Returns:
+        A tuple with the feature names and the LDA components. Both are shared between calls, and must not be modified.
+    """  # noqa: E501
+    tf, feature_names = _vectorize(
+        docs,
+        min_document_frequency=min_document_frequency,
+    )
+
     alpha = None
     beta = None
     learning = "batch"  # Batch or Online
@@ -54,32 +188,191 @@ def extract_topics_with_lda(
         learning_method=learning,
         learning_decay=0.7,
         learning_offset=10.0,
-        max_iter=5000,
+        max_iter=max_iter,
         batch_size=128,
-        evaluate_every=-1,
+        # perplexity is only checked against `perp_tol` when it is evaluated,
+        # so this is what allows the fit to stop before `max_iter`.
+        evaluate_every=10,
         total_samples=1000000.0,
         perp_tol=0.1,
         mean_change_tol=0.001,
         max_doc_update_iter=100,
         random_state=0,
+        n_jobs=-1,
     )
 
     lda.fit(tf)
 
-    # `lda.components_` hold the entire list of topics found by LDA.
-    # notice that for `lda.components_`, the topic is a list of indexes
-    # where the index will map to a token (~word) in `feature_names`.
-    # as an example, the next line gets all tokens of the first topic
+    return feature_names, lda.components_
 
-    # first_topic = lda.components_[0]
-    # topic_words = [feature_names[i] for i in first_topic]
 
-    # `topic.argsort()` will return the indexes that would sort the topics,
-    # in ascending order
-    # since we want the most latent topics, we reverse the list with `[::-1]`
+def _extract_topics_with_tfidf(
+    docs: list[str],
+    *,
+    min_document_frequency: float,
+    n_words_per_topic: int,
+) -> list[list[str]]:
+    """Extracts one topic for each document, made of the words with the highest TF-IDF.
 
-    topics: list[list[str]] = [
-        [feature_names[i] for i in topic.argsort()[::-1]] for topic in lda.components_
-    ]
+    Used instead of LDA when there are not more documents than topics.
 
-    return topics
+    Args:
+        docs (list[str]): List of documents.
+        min_document_frequency (float): CountVectorizer parameter - Minimum document frequency for the word to appear on the bag of words.
+        n_words_per_topic (int): Number of words to keep in each topic, sorted by relevance.
+
+    Returns:
+        List of topics, where the i-th topic is a list of words of the i-th document.
+    """  # noqa: E501
+    vectorizer = _create_vectorizer(min_document_frequency)
+    tf = vectorizer.fit_transform(docs)
+    tfidf = TfidfTransformer().fit_transform(tf)
+
+    return _get_top_words(
+        vectorizer.get_feature_names_out(),
+        tfidf.toarray(),
+        n_words_per_topic,
+    )
+
+
+def extract_topics_with_lda(
+    docs: list[str],
+    *,
+    min_document_frequency: float,
+    n_topics: int,
+    n_words_per_topic: int = 30,
+    max_iter: int = 100,
+) -> list[list[str]]:
+    """Extracts topics from a list of documents using LDA method.
+
+    !!!note
+        The E-step of LDA runs in parallel on all available cores (`n_jobs=-1`).
+        On Windows, calls to this function must be protected by an
+        `#!python if __name__ == "__main__":` guard.
+
+    !!!note
+        The fitted model is cached for the last 8 combinations of `docs`,
+        `min_document_frequency`, `n_topics`, and `max_iter`.
+
+    !!!note
+        If there are not more documents than `n_topics`, LDA is not fitted.
+        Instead, each document becomes a topic, made of its words with the
+        highest TF-IDF.
+
+    Args:
+        docs (list[str]): List of documents.
+        min_document_frequency (float): CountVectorizer parameter - Minimum document frequency for the word to appear on the bag of words.
+        n_topics (int): LDA parameter - Number of topics to generate.
+        n_words_per_topic (int): Number of words to keep in each topic, sorted by relevance. If the vocabulary is smaller, all words are kept. Defaults to 30.
+        max_iter (int): LDA parameter - Maximum number of passes over the documents. The fit stops earlier if the perplexity converges. Defaults to 100.
+
+    Returns:
+        list of topics, where a topic is a list of words.
+
+    Examples:
+        >>> extract_topics_with_lda(  # doctest: +SKIP
+        ...     docs=["detecting code smells with machine learning", "code smells detection tools", "error detection in Java software with machine learning"],
+        ...     min_document_frequency=0.1,
+        ...     n_topics=2,
+        ... )
+        [["word1 topic1", "word2 topic1"], ["word1 topic2", "word2 topic2"]]
+    """  # noqa: E501
+    if len(docs) <= n_topics:
+        return _extract_topics_with_tfidf(
+            docs,
+            min_document_frequency=min_document_frequency,
+            n_words_per_topic=n_words_per_topic,
+        )
+
+    feature_names, components = _fit_lda(
+        tuple(docs),
+        min_document_frequency=min_document_frequency,
+        n_topics=n_topics,
+        max_iter=max_iter,
+    )
+
+    return _get_top_words(feature_names, components, n_words_per_topic)
+
+
+class LdaTopicExtractor:
+    """Extracts topics from a stream of documents with online LDA.
+
+    Differently from [`extract_topics_with_lda`][sesg.topic_extraction.extract_topics_with_lda], the vectorizer and the LDA model are kept between calls, so new documents can be fed with [`partial_fit`][sesg.topic_extraction.lda_strategy.LdaTopicExtractor.partial_fit] without fitting everything again.
+
+    !!!note
+        The vocabulary is built from the documents given to the constructor.
+        Tokens that only appear in documents given to `partial_fit` are ignored.
+
+    Examples:
+        >>> extractor = LdaTopicExtractor(  # doctest: +SKIP
+        ...     ["detecting code smells with machine learning", "code smells detection tools"],
+        ...     min_document_frequency=0.1,
+        ...     n_topics=2,
+        ... )
+        >>> extractor.partial_fit(["error detection in Java software with machine learning"])  # doctest: +SKIP
+        >>> extractor.get_topics(n_words_per_topic=2)  # doctest: +SKIP
+        [["word1 topic1", "word2 topic1"], ["word1 topic2", "word2 topic2"]]
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        docs: list[str],
+        *,
+        min_document_frequency: float,
+        n_topics: int,
+    ) -> None:
+        """Builds the vocabulary and fits LDA with a first set of documents.
+
+        Args:
+            docs (list[str]): List of documents.
+            min_document_frequency (float): CountVectorizer parameter - Minimum document frequency for the word to appear on the bag of words.
+            n_topics (int): LDA parameter - Number of topics to generate.
+        """  # noqa: E501
+        self.vectorizer = _create_vectorizer(min_document_frequency)
+        tf = self.vectorizer.fit_transform(docs)
+
+        self.feature_names: np.ndarray = self.vectorizer.get_feature_names_out()
+
+        self.lda = LatentDirichletAllocation(
+            n_components=n_topics,
+            learning_method="online",
+            learning_decay=0.7,
+            learning_offset=10.0,
+            total_samples=1000000.0,
+            mean_change_tol=0.001,
+            max_doc_update_iter=100,
+            random_state=0,
+            n_jobs=-1,
+        )
+
+        self.lda.partial_fit(tf)
+
+    def partial_fit(
+        self,
+        docs: list[str],
+    ) -> None:
+        """Updates LDA with new documents.
+
+        Args:
+            docs (list[str]): List of new documents.
+        """
+        tf = self.vectorizer.transform(docs)
+        self.lda.partial_fit(tf)
+
+    def get_topics(
+        self,
+        n_words_per_topic: int = 30,
+    ) -> list[list[str]]:
+        """Gets the current topics.
+
+        Args:
+            n_words_per_topic (int): Number of words to keep in each topic, sorted by relevance. If the vocabulary is smaller, all words are kept. Defaults to 30.
+
+        Returns:
+            List of topics, where a topic is a list of words.
+        """  # noqa: E501
+        return _get_top_words(
+            self.feature_names,
+            self.lda.components_,
+            n_words_per_topic,
+        )
@@ -121,6 +121,13 @@ def test_evaluation_start_set_precision_should_return_0_when_n_scopus_results_is
     assert evaluation.start_set_precision == 0
 
 
+def test_study_should_not_have_instance_dict():
+    study = Study(1, "Machine Learning")
+
+    assert not hasattr(study, "__dict__")
+    assert study.processed_title == process_title("Machine Learning")
+
+
 def mock_study_list(n: int) -> list[Study]:
     return [Study(1, "Study")] * n
 
@@ -173,3 +173,54 @@ def test_create_citation_graph_should_return_correct_styles_and_edges_when_start
     ]
 
     assert g.body == expected
+
+
+def test_breadth_first_search_should_not_return_nodes_that_were_already_visited():
+    visited = {3}
+
+    result = graph._breadth_first_search(
+        adjacency_list={
+            1: [2],
+            2: [3, 4],
+            4: [5, 6],
+        },
+        starting_node=2,
+        visited=visited,
+    )
+    expected = [2, 4, 6, 5]
+
+    assert result == expected
+    assert visited == {2, 3, 4, 5, 6}
+
+
+def test_breadth_first_search_should_return_empty_list_when_starting_node_was_already_visited():
+    result = graph._breadth_first_search(
+        adjacency_list={1: [2]},
+        starting_node=1,
+        visited={1},
+    )
+    expected = []
+
+    assert result == expected
+
+
+def test_contiguous_snowballing_should_find_the_same_nodes_as_snowballing():
+    adjacency_list = {
+        1: [2],
+        2: [3, 4],
+        4: [5, 6],
+        7: [6, 8, 9],
+    }
+    nodes = [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    start_set = [4, 7]
+
+    result = graph.contiguous_snowballing(
+        adjacency_list=graph.to_contiguous_adjacency_list(adjacency_list, nodes=nodes),
+        start_set=[nodes.index(node) for node in start_set],
+    )
+    expected = graph.snowballing(
+        adjacency_list=adjacency_list,
+        start_set=start_set,
+    )
+
+    assert [nodes[i] for i in result] == sorted(expected)
@@ -31,12 +31,42 @@ def test_parse_response_should_return_response_with_2_pages():
     assert len(parsed.entries) == 25
 
 
+def test_page_and_entry_should_not_have_instance_dict():
+    entry = client_module.Page.Entry(
+        scopus_id="1",
+        title="",
+        cited_by_count=None,
+        _rest={},
+    )
+    page = client_module.Page(
+        n_results=1,
+        n_pages=1,
+        current_page=1,
+        entries=[entry],
+    )
+
+    assert not hasattr(entry, "__dict__")
+    assert not hasattr(page, "__dict__")
+
+
 def test_check_api_key_is_expired_should_return_true_when_response_has_status_code_429():
     response = httpx.Response(429)
 
     assert client_module.check_api_key_is_expired(response) is True
 
 
+def test_check_api_key_quota_is_exhausted_should_return_true_when_no_requests_remain():
+    response = httpx.Response(200, headers={"X-RateLimit-Remaining": "0"})
+
+    assert client_module.check_api_key_quota_is_exhausted(response) is True
+
+
+def test_check_api_key_quota_is_exhausted_should_return_false_without_rate_limit_header():
+    response = httpx.Response(200)
+
+    assert client_module.check_api_key_quota_is_exhausted(response) is False
+
+
 def test_check_string_is_invalid_should_return_true_when_response_has_status_code_400():
     response = httpx.Response(400)
 
@@ -49,29 +79,25 @@ def test_check_string_is_invalid_should_return_true_when_response_has_status_cod
     assert client_module.check_string_is_invalid(response) is True
 
 
-def test_create_clients_list_should_create_4_clients():
-    api_keys_list = ["k1", "k2", "k3", "k4"]
+def test_create_client_should_return_httpx_async_client():
+    client = client_module.create_client()
 
-    clients_list = client_module.create_clients_list(api_keys_list)
+    assert isinstance(client, httpx.AsyncClient)
 
-    assert len(clients_list) == 4
 
+def test_create_client_should_not_assign_api_key_to_client():
+    client = client_module.create_client()
 
-def test_create_clients_list_should_return_list_of_httpx_async_clients():
-    api_keys_list = ["k1", "k2", "k3", "k4"]
+    assert "apiKey" not in client.params
 
-    clients_list = client_module.create_clients_list(api_keys_list)
 
-    assert all(isinstance(client, httpx.AsyncClient) for client in clients_list)
-
-
-def test_create_clients_list_should_assign_api_keys_to_clients():
-    api_keys_list = ["k1", "k2", "k3", "k4"]
-
-    clients_list = client_module.create_clients_list(api_keys_list)
+def test_scopus_client_should_share_one_client_between_api_keys():
+    scopus_client = client_module.ScopusClient(
+        api_keys_list=["k1", "k2", "k3", "k4"],
+    )
 
-    for client, key in zip(clients_list, api_keys_list):
-        assert client.params.get("apiKey") == key
+    assert isinstance(scopus_client.client, httpx.AsyncClient)
+    assert scopus_client.api_keys.items == ["k1", "k2", "k3", "k4"]
 
 
 def test_create_params_pagination_should_create_2_params():
@@ -122,32 +148,32 @@ def test_create_params_pagination_should_limit_to_199_pages():
     assert len(params) == 199
 
 
-def test_scopus_client_should_have_4_clients():
+def test_scopus_client_should_have_4_api_keys():
     scopus_client = client_module.ScopusClient(
         api_keys_list=["k1", "k2", "k3", "k4"],
     )
 
-    assert len(scopus_client.clients_list) == 4
+    assert len(scopus_client.api_keys) == 4
 
 
-def test_scopus_client_delete_client_should_remove_client_from_clients_list():
+def test_scopus_client_delete_api_key_should_remove_api_key_from_api_keys():
     scopus_client = client_module.ScopusClient(
         api_keys_list=["k1", "k2", "k3", "k4"],
     )
 
-    assert len(scopus_client.clients_list) == 4
+    assert len(scopus_client.api_keys) == 4
 
-    first_client = next(scopus_client.clients_list)
+    first_api_key = next(scopus_client.api_keys)
 
-    scopus_client.delete_client(first_client)
+    scopus_client.delete_api_key(first_api_key)
 
-    assert all(client != first_client for client in scopus_client.clients_list.items)
+    assert first_api_key not in scopus_client.api_keys.items
 
-    assert len(scopus_client.clients_list) == 3
+    assert len(scopus_client.api_keys) == 3
 
 
 @pytest.mark.asyncio
-async def test_scopus_search_fetch_should_delete_expired_client(
+async def test_scopus_search_fetch_should_delete_expired_api_key(
     httpx_mock: HTTPXMock,
 ):
     httpx_mock.add_response(
@@ -176,11 +202,29 @@ async def test_scopus_search_fetch_should_delete_expired_client(
     async for _ in client.search("code"):
         pass
 
-    assert len(client.clients_list) == 3
+    assert len(client.api_keys) == 3
+
+
+@pytest.mark.asyncio
+async def test_scopus_search_fetch_should_delete_api_key_with_exhausted_quota(
+    httpx_mock: HTTPXMock,
+):
+    httpx_mock.add_response(
+        200,
+        url="https://api.elsevier.com/content/search/scopus/?apiKey=k1&query=code&start=0",
+        headers={"X-RateLimit-Remaining": "0"},
+    )
+
+    client = client_module.ScopusClient(["k1", "k2"])
+
+    response = await client.fetch({"query": "code", "start": 0})
+
+    assert response.status_code == 200
+    assert client.api_keys.items == ["k2"]
 
 
 @pytest.mark.asyncio
-async def test_scopus_search_fetch_should_raise_out_of_api_keys_error_when_all_clients_are_expired(
+async def test_scopus_search_fetch_should_raise_out_of_api_keys_error_when_all_api_keys_are_expired(
     httpx_mock: HTTPXMock,
 ):
     httpx_mock.add_response(429)
@@ -282,6 +326,36 @@ async def test_scopus_search_search_should_yield_2_pages(
     assert len(pages_list) == 2
 
 
+@pytest.mark.asyncio
+async def test_scopus_search_search_many_should_yield_2_pages_of_each_query(
+    httpx_mock: HTTPXMock,
+):
+    httpx_mock.add_response(
+        200,
+        json={
+            "search-results": {
+                "opensearch:totalResults": 35,
+                "opensearch:startIndex": 0,
+                "entry": [
+                    {
+                        "dc:title": "",
+                        "dc:identifier": "",
+                    },
+                ],
+            }
+        },
+    )
+
+    client = client_module.ScopusClient(["k1", "k2"])
+
+    queries = ["code", "smell", "refactoring"]
+    pages_per_query: dict[str, int] = {query: 0 for query in queries}
+    async for query, _ in client.search_many(queries):
+        pages_per_query[query] += 1
+
+    assert pages_per_query == {"code": 2, "smell": 2, "refactoring": 2}
+
+
 @pytest.mark.asyncio
 async def test_scopus_search_search_should_yield_3_pages_even_if_one_key_expired(
     httpx_mock: HTTPXMock,
@@ -358,6 +432,79 @@ async def test_scopus_search_search_should_yield_3_pages_even_if_one_key_expired
     assert all(seen_pages)
 
 
+@pytest.mark.asyncio
+async def test_scopus_search_iter_entries_should_yield_entries_of_all_pages_even_if_one_key_expired(
+    httpx_mock: HTTPXMock,
+):
+    httpx_mock.add_response(
+        429,
+        url="https://api.elsevier.com/content/search/scopus/?apiKey=k1&query=code&start=0",
+    )
+
+    httpx_mock.add_response(
+        200,
+        url="https://api.elsevier.com/content/search/scopus/?apiKey=k2&query=code&start=0",
+        json={
+            "search-results": {
+                "opensearch:totalResults": 60,
+                "opensearch:startIndex": 0,
+                "entry": [
+                    {
+                        "dc:title": "first page",
+                        "dc:identifier": "first page",
+                    },
+                ]
+                * 25,
+            }
+        },
+    )
+
+    httpx_mock.add_response(
+        200,
+        url="https://api.elsevier.com/content/search/scopus/?apiKey=k2&query=code&start=25",
+        json={
+            "search-results": {
+                "opensearch:totalResults": 60,
+                "opensearch:startIndex": 25,
+                "entry": [
+                    {
+                        "dc:title": "second page",
+                        "dc:identifier": "second page",
+                    },
+                ]
+                * 25,
+            }
+        },
+    )
+
+    httpx_mock.add_response(
+        200,
+        url="https://api.elsevier.com/content/search/scopus/?apiKey=k2&query=code&start=50",
+        json={
+            "search-results": {
+                "opensearch:totalResults": 60,
+                "opensearch:startIndex": 50,
+                "entry": [
+                    {
+                        "dc:title": "third page",
+                        "dc:identifier": "third page",
+                    },
+                ]
+                * 10,
+            }
+        },
+    )
+
+    client = client_module.ScopusClient(["k1", "k2"])
+
+    titles: list[str] = []
+    async for entry in client.iter_entries("code"):
+        titles.append(entry.title)
+
+    assert len(titles) == 60
+    assert set(titles) == {"first page", "second page", "third page"}
+
+
 @pytest.mark.asyncio
 async def test_scopus_search_search_should_return_one_page_when_scopus_finds_only_one_page(
     httpx_mock: HTTPXMock,
@@ -390,7 +537,7 @@ async def test_scopus_search_search_should_return_one_page_when_scopus_finds_onl
 
 
 @pytest.mark.asyncio
-async def test_scopus_search_get_expired_clients_should_return_2_clients(
+async def test_scopus_search_get_expired_api_keys_should_return_2_api_keys(
     httpx_mock: HTTPXMock,
 ):
     dummy_query = client_module.ScopusClient.DUMMY_QUERY
@@ -412,15 +559,13 @@ async def test_scopus_search_get_expired_clients_should_return_2_clients(
 
     client = client_module.ScopusClient(["k1", "k2", "k3"])
 
-    expired_clients = await client.get_expired_clients()
-    for client in expired_clients:
-        assert client.params.get("apiKey") != "k2"
+    expired_api_keys = await client.get_expired_api_keys()
 
-    assert len(expired_clients) == 2
+    assert expired_api_keys == ["k1", "k3"]
 
 
 @pytest.mark.asyncio
-async def test_scopus_search_purge_expired_clients_should_purge_2_clients(
+async def test_scopus_search_purge_expired_api_keys_should_purge_2_api_keys(
     httpx_mock: HTTPXMock,
 ):
     dummy_query = client_module.ScopusClient.DUMMY_QUERY
@@ -442,10 +587,10 @@ async def test_scopus_search_purge_expired_clients_should_purge_2_clients(
 
     client = client_module.ScopusClient(["k1", "k2", "k3"])
 
-    await client.purge_expired_clients()
+    await client.purge_expired_api_keys()
 
-    assert len(client.clients_list) == 1
-    assert next(client.clients_list).params.get("apiKey") == "k2"
+    assert len(client.api_keys) == 1
+    assert next(client.api_keys) == "k2"
 
 
 @pytest.mark.asyncio
@@ -777,3 +922,75 @@ async def test_scopus_search_should_retry_at_most_3_times_when_ssl_occurs(
                 "start": 0,
             }
         )
+
+
+@pytest.mark.asyncio
+async def test_scopus_client_should_close_client_when_exiting_context():
+    async with client_module.ScopusClient(["k1", "k2"]) as client:
+        assert not client.client.is_closed
+
+    assert client.client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_scopus_client_should_not_close_client_passed_by_caller():
+    shared_client = client_module.create_client()
+
+    async with client_module.ScopusClient(["k1"], client=shared_client):
+        pass
+
+    async with client_module.ScopusClient(["k2"], client=shared_client) as client:
+        assert client.client is shared_client
+
+    assert not shared_client.is_closed
+
+    await shared_client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_scopus_client_should_reuse_client_passed_by_caller_between_instances(
+    httpx_mock: HTTPXMock,
+):
+    httpx_mock.add_response(
+        200,
+        url="https://api.elsevier.com/content/search/scopus/?apiKey=k1&query=code&start=0",
+    )
+    httpx_mock.add_response(
+        200,
+        url="https://api.elsevier.com/content/search/scopus/?apiKey=k2&query=code&start=0",
+    )
+
+    async with client_module.create_client() as shared_client:
+        for api_key in ("k1", "k2"):
+            client = client_module.ScopusClient([api_key], client=shared_client)
+            response = await client.fetch({"query": "code", "start": 0})
+
+            assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_scopus_client_warmup_should_not_use_api_keys(
+    httpx_mock: HTTPXMock,
+):
+    httpx_mock.add_response(
+        401,
+        method="HEAD",
+        url="https://api.elsevier.com/content/search/scopus/",
+    )
+
+    client = client_module.ScopusClient(["k1", "k2"])
+
+    await client.warmup()
+
+    assert next(client.api_keys) == "k1"
+
+
+@pytest.mark.asyncio
+async def test_scopus_client_warmup_should_ignore_connection_errors(
+    httpx_mock: HTTPXMock,
+):
+    httpx_mock.add_exception(httpx.ConnectError("unreachable"))
+
+    client = client_module.ScopusClient(["k1"])
+
+    await client.warmup()
@@ -97,3 +97,14 @@ def test_mutable_cycle_iteration_should_restart_from_first_item():
 
         if i == 5:
             break
+
+
+def test_mutable_cycle_items_should_start_from_next_item():
+    items = [1, 2, 3]
+    cycle = MutableCycle(items)
+
+    next(cycle)
+    cycle.delete_item(3)
+
+    assert cycle.items == [2, 1]
+    assert next(cycle) == 2
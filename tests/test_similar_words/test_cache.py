@@ -0,0 +1,54 @@
+import shelve
+
+from sesg.similar_words import CachedSimilarWordsGenerator
+
+
+class CountingBatchSimilarWordsGenerator:
+    def __init__(self):
+        self.batches: list[list[str]] = []
+
+    def __call__(self, word: str) -> list[str]:
+        return self.generate_batch([word])[0]
+
+    def generate_batch(self, words: list[str]) -> list[list[str]]:
+        self.batches.append(words)
+        return [[f"{word}s"] for word in words]
+
+
+def test_cached_similar_words_generator_should_only_generate_missing_words_in_one_batch():
+    generator = CountingBatchSimilarWordsGenerator()
+    cached = CachedSimilarWordsGenerator(generator)
+
+    cached.generate_batch(["code", "smell"])
+    result = cached.generate_batch(["smell", "refactoring", "code", "refactoring"])
+
+    assert result == [["smells"], ["refactorings"], ["codes"], ["refactorings"]]
+    assert generator.batches == [["code", "smell"], ["refactoring"]]
+
+
+def test_cached_similar_words_generator_should_not_call_generator_when_all_words_are_cached():
+    generator = CountingBatchSimilarWordsGenerator()
+    cached = CachedSimilarWordsGenerator(generator)
+
+    cached("code")
+    cached("code")
+
+    assert generator.batches == [["code"]]
+
+
+def test_cached_similar_words_generator_should_reuse_persistent_cache(tmp_path):
+    path = str(tmp_path / "similar_words")
+
+    with shelve.open(path) as cache:
+        CachedSimilarWordsGenerator(
+            CountingBatchSimilarWordsGenerator(), cache=cache
+        ).generate_batch(["code", "smell"])
+
+    generator = CountingBatchSimilarWordsGenerator()
+    with shelve.open(path) as cache:
+        result = CachedSimilarWordsGenerator(generator, cache=cache).generate_batch(
+            ["code", "refactoring"]
+        )
+
+    assert result == [["codes"], ["refactorings"]]
+    assert generator.batches == [["refactoring"]]
@@ -1,4 +1,3 @@
-import pytest
 from sesg.similar_words.stemming_filter import (
     check_similar_word_is_relevant,
     check_stemmed_similar_word_is_duplicate,
@@ -10,101 +9,87 @@ from sesg.similar_words.stemming_filter import (
 )
 
 
-@pytest.mark.parametrize(
-    "s1,s2,expected",
-    [
-        ("computer", "computers", True),
-        ("computer", "computation", False),
-    ],
-)
-def test_strings_are_close(
-    s1,
-    s2,
-    expected,
-):
-    result = check_strings_are_close(s1, s2)
-
-    assert result == expected
-
-
-@pytest.mark.parametrize(
-    "s1,s2,expected",
-    [
-        ("string", "big string here", True),
-        ("machine learning", "machine knowledge", True),
-        ("machine learning", "machine learning", False),
-    ],
-)
-def test_strings_are_distant(
-    s1,
-    s2,
-    expected,
-):
-    result = check_strings_are_distant(s1, s2)
-
-    assert result == expected
-
-
-@pytest.mark.parametrize(
-    "stemmed_similar_word,stemmed_word,expected",
-    [
-        ("word", "word", False),
-        ("word", "worldwide", True),
-    ],
-)
-def test_stemmed_similar_word_is_valid(
-    stemmed_similar_word,
-    stemmed_word,
-    expected,
-):
-    result = check_stemmed_similar_word_is_valid(
-        stemmed_similar_word=stemmed_similar_word,
-        stemmed_word=stemmed_word,
-    )
+STRINGS_ARE_CLOSE_CASES = [
+    ("computer", "computers", True),
+    ("computer", "computation", False),
+]
 
-    assert result == expected
+STRINGS_ARE_DISTANT_CASES = [
+    ("string", "big string here", True),
+    ("machine learning", "machine knowledge", True),
+    ("machine learning", "machine learning", False),
+]
 
+STEMMED_SIMILAR_WORD_IS_VALID_CASES = [
+    ("word", "word", False),
+    ("word", "worldwide", True),
+]
 
-@pytest.mark.parametrize(
-    "stemmed_similar_word,stemmed_similar_words_list,expected",
-    [
-        ("thing", ["things", "word"], True),
-        ("tests", ["machine", "learning"], False),
-    ],
-)
-def test_stemmed_similar_word_is_duplicate(
-    stemmed_similar_word,
-    stemmed_similar_words_list,
-    expected,
-):
-    result = check_stemmed_similar_word_is_duplicate(
-        stemmed_similar_word=stemmed_similar_word,
-        stemmed_similar_words_list=stemmed_similar_words_list,
-    )
+STEMMED_SIMILAR_WORD_IS_DUPLICATE_CASES = [
+    ("thing", ["things", "word"], True),
+    ("tests", ["machine", "learning"], False),
+]
 
-    assert result == expected
-
-
-@pytest.mark.parametrize(
-    "word,expected",
-    [
-        ("-", True),
-        ("--", False),
-        ("*", True),
-        ("word", False),
-        ("software", False),
-        ("software-", False),
-        ("-software", False),
-        ("-software-", False),
-        ("-soft-ware-", False),
-    ],
-)
-def test_check_word_is_punctuation_should_return_true_when_word_is_punctuation(
-    word, expected
-):
-    result = check_word_is_punctuation(word)
+WORD_IS_PUNCTUATION_CASES = [
+    ("-", True),
+    ("--", False),
+    ("*", True),
+    ("word", False),
+    ("software", False),
+    ("software-", False),
+    ("-software", False),
+    ("-software-", False),
+    ("-soft-ware-", False),
+]
+
+
+def test_strings_are_close():
+    for s1, s2, expected in STRINGS_ARE_CLOSE_CASES:
+        result = check_strings_are_close(s1, s2)
+
+        assert result == expected, (s1, s2)
+
+
+def test_strings_are_distant():
+    for s1, s2, expected in STRINGS_ARE_DISTANT_CASES:
+        result = check_strings_are_distant(s1, s2)
+
+        assert result == expected, (s1, s2)
+
+
+def test_stemmed_similar_word_is_valid():
+    for (
+        stemmed_similar_word,
+        stemmed_word,
+        expected,
+    ) in STEMMED_SIMILAR_WORD_IS_VALID_CASES:
+        result = check_stemmed_similar_word_is_valid(
+            stemmed_similar_word=stemmed_similar_word,
+            stemmed_word=stemmed_word,
+        )
+
+        assert result == expected, (stemmed_similar_word, stemmed_word)
+
+
+def test_stemmed_similar_word_is_duplicate():
+    for (
+        stemmed_similar_word,
+        stemmed_similar_words_list,
+        expected,
+    ) in STEMMED_SIMILAR_WORD_IS_DUPLICATE_CASES:
+        result = check_stemmed_similar_word_is_duplicate(
+            stemmed_similar_word=stemmed_similar_word,
+            stemmed_similar_words_list=stemmed_similar_words_list,
+        )
+
+        assert result == expected, (stemmed_similar_word, stemmed_similar_words_list)
+
+
+def test_check_word_is_punctuation_should_return_true_when_word_is_punctuation():
+    for word, expected in WORD_IS_PUNCTUATION_CASES:
+        result = check_word_is_punctuation(word)
 
-    assert result is expected
+        assert result is expected, word
 
 
 def test_check_similar_word_is_relevant_should_return_false_when_word_is_punctuation():
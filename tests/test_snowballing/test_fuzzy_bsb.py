@@ -54,6 +54,32 @@ def test_check_title_is_in_text_should_return_false_when_title_is_not_in_study()
     assert result == expected
 
 
+def test_check_titles_are_in_text_should_agree_with_check_title_is_in_text():
+    # arrange
+    study = "something something here goes a reference: machine learning applied in biomechanics: a systematic literature review."
+    titles = [
+        "machine learning applied in biomechanics: a systematic literature review.",
+        "Machine learning applied in biomechanics, a systematic literature review.",
+        "Machine learning in aerospacial engineering: A systematic literature review.",
+        "a title that is longer than the study itself, so no window of the study can fit it, not even one, since the study is short",
+        "",
+    ]
+
+    expected = [
+        fuzzy_bsb.check_title_is_in_text(text=study, title=title) for title in titles
+    ]
+
+    # act
+    result = fuzzy_bsb.check_titles_are_in_text(
+        text=study,
+        titles=titles,
+    )
+
+    # assert
+    assert result == expected
+    assert result[:3] == [True, True, False]
+
+
 def test_pooled_check_title_is_in_text_should_return_false_when_skip_is_true():
     # arrange
     text = "something something here goes a reference: machine learning applied in biomechanics: a systematic literature review."
@@ -147,6 +173,18 @@ def test_preprocess_title_should_not_remove_special_characters():
     assert result == expected
 
 
+def test_preprocess_title_should_handle_non_ascii_characters():
+    # arrange
+    value = "  Análise de código. SMELLS "
+
+    expected = "análisedecódigosmells"
+
+    # act
+    result = fuzzy_bsb.preprocess_title(value)
+
+    assert result == expected
+
+
 def test_preprocess_text_should_strip_string_turn_to_lower_case_remove_spaces_dots_line_breaks_and_line_carriages():
     # arrange
     value = "  leading whitespace .dots   spaces UPPERCASE \n line break \r line carriage trailing whitespaces   "
@@ -189,3 +227,27 @@ def test_snowballing_study_instance_should_have_preprocessed_title_and_text_cont
 
     assert snowballing_study.title == preprocessed_title
     assert snowballing_study.text_content == preprocessed_text_content
+
+
+def test_preprocess_text_should_handle_non_ascii_characters():
+    # arrange
+    value = "  Análise de código. \r\n SMELLS "
+
+    expected = "análisedecódigosmells"
+
+    # act
+    result = fuzzy_bsb.preprocess_text(value)
+
+    assert result == expected
+
+
+def test_snowballing_study_instance_should_not_have_instance_dict():
+    # act
+    snowballing_study = fuzzy_bsb.FuzzyBackwardSnowballingStudy(
+        id=1,
+        text_content="text",
+        title="title",
+    )
+
+    # assert
+    assert not hasattr(snowballing_study, "__dict__")
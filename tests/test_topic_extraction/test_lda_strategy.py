@@ -1,5 +1,10 @@
+import numpy as np
 import pytest
-from sesg.topic_extraction import extract_topics_with_lda
+from sesg.topic_extraction import (
+    LdaTopicExtractor,
+    extract_topics_with_lda,
+    lda_strategy,
+)
 
 from .test_fixtures import docs
 
@@ -35,3 +40,105 @@ def test_each_lda_topic_should_have_at_least_10_entries_even_with_high_document_
 ):
     for topic in lda_topics_with_min_document_frequency_04:
         assert len(topic) >= 10
+
+
+def test_each_lda_topic_should_have_at_most_30_entries_by_default(
+    lda_topics_with_min_document_frequency_04: list[list[str]],
+):
+    for topic in lda_topics_with_min_document_frequency_04:
+        assert len(topic) <= 30
+
+
+def test_lda_topics_should_have_n_words_per_topic_entries(
+    docs: list[str],
+):
+    topics = extract_topics_with_lda(
+        docs,
+        min_document_frequency=0.4,
+        n_topics=2,
+        n_words_per_topic=5,
+    )
+
+    for topic in topics:
+        assert len(topic) == 5
+
+
+def test_lda_topics_with_less_words_per_topic_should_be_prefix_of_topics_with_more_words(
+    docs: list[str],
+    lda_topics_with_min_document_frequency_04: list[list[str]],
+):
+    topics = extract_topics_with_lda(
+        docs,
+        min_document_frequency=0.4,
+        n_topics=2,
+        n_words_per_topic=5,
+    )
+
+    for topic, larger_topic in zip(topics, lda_topics_with_min_document_frequency_04):
+        assert topic == larger_topic[:5]
+
+
+def test_lda_topic_extractor_should_keep_topics_after_partial_fit(
+    docs: list[str],
+):
+    extractor = LdaTopicExtractor(
+        docs[: len(docs) // 2],
+        min_document_frequency=0.1,
+        n_topics=2,
+    )
+
+    extractor.partial_fit(docs[len(docs) // 2 :])
+    topics = extractor.get_topics(n_words_per_topic=5)
+
+    assert len(topics) == 2
+    for topic in topics:
+        assert len(topic) == 5
+
+
+def test_top_indexes_above_threshold_should_match_the_highest_scores():
+    rng = np.random.default_rng(0)
+    components = rng.gamma(0.1, 1, (3, 1000)) + 0.1
+
+    result = lda_strategy._get_top_indexes_above_threshold(components, 10)
+    expected = np.argsort(-components, axis=1)[:, :10]
+
+    assert result is not None
+    assert (result == expected).all()
+
+
+def test_top_indexes_above_threshold_should_return_none_when_there_are_not_enough_candidates():
+    components = np.ones((2, 100))
+
+    result = lda_strategy._get_top_indexes_above_threshold(components, 10)
+
+    assert result is None
+
+
+def test_lda_topics_should_have_one_topic_per_document_when_there_are_not_more_documents_than_topics():
+    docs = ["machine learning for code smells", "software testing with mutation"]
+
+    topics = extract_topics_with_lda(
+        docs,
+        min_document_frequency=0.1,
+        n_topics=2,
+        n_words_per_topic=3,
+    )
+
+    assert len(topics) == 2
+    for doc, topic in zip(docs, topics):
+        assert len(topic) == 3
+        for word in topic:
+            assert word in doc
+
+
+def test_lda_topics_with_different_n_topics_should_share_the_bag_of_words(
+    docs: list[str],
+):
+    lda_strategy._vectorize.cache_clear()
+
+    extract_topics_with_lda(docs, min_document_frequency=0.1, n_topics=2)
+    extract_topics_with_lda(docs, min_document_frequency=0.1, n_topics=3)
+
+    cache_info = lda_strategy._vectorize.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1